@@ -0,0 +1,48 @@
+import pygame
+import logging
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from production import BackgroundProductionLine, SceneLayer
+from telemetry import SystemMonitor, create_source
+from session_history import Leaderboard
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+
+class AppContext:
+    def __init__(self, telemetry_spec='psutil', session_store=None):
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Production Line Simulator")
+        self.clock = pygame.time.Clock()
+        self.telemetry_spec = telemetry_spec
+        self.session_store = session_store
+        self.leaderboard = Leaderboard(session_store) if session_store is not None else None
+        self.monitor = None
+        self.background = None
+        self.scene = None
+
+    def create_source(self):
+        return create_source(self.telemetry_spec)
+
+    def system_monitor(self):
+        if self.monitor is None:
+            self.monitor = SystemMonitor(source=self.create_source())
+            self.monitor.start()
+        return self.monitor
+
+    def background_line(self):
+        if self.background is None:
+            self.background = BackgroundProductionLine()
+        return self.background
+
+    def scene_layer(self):
+        if self.scene is None:
+            self.scene = SceneLayer()
+        return self.scene
+
+    def close(self):
+        if self.monitor is not None:
+            self.monitor.stop()
+            self.monitor.source.close()
+            self.monitor = None
+        pygame.quit()
@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import queue
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+AUDIT_FIELDS = ('operator', 'timestamp', 'tick', 'sim_time', 'lane', 'screw_id', 'defect_type',
+                'decision', 'outcome')
+AUDIT_BATCH_SIZE = 512
+AUDIT_SYNC_INTERVAL = 1.0
+
+_STOP = object()
+
+
+class JsonlAuditWriter:
+    def __init__(self, path):
+        self.file = open(path, 'a', buffering=1 << 16)
+
+    def write(self, rows):
+        self.file.write(''.join(json.dumps(dict(zip(AUDIT_FIELDS, row))) + '\n' for row in rows))
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.sync()
+        self.file.close()
+
+
+class SqliteAuditWriter:
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS audit ("
+            "id INTEGER PRIMARY KEY, operator TEXT, timestamp REAL, tick INTEGER, sim_time REAL, "
+            "lane INTEGER, screw_id INTEGER, defect_type TEXT, decision TEXT, outcome TEXT)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS audit_operator_time ON audit (operator, timestamp)")
+        self.connection.commit()
+        self.insert = f"INSERT INTO audit ({', '.join(AUDIT_FIELDS)}) VALUES ({', '.join('?' * len(AUDIT_FIELDS))})"
+
+    def write(self, rows):
+        self.connection.executemany(self.insert, rows)
+
+    def sync(self):
+        self.connection.commit()
+
+    def close(self):
+        self.sync()
+        self.connection.close()
+
+
+def open_audit_writer(path):
+    if path.endswith(('.db', '.sqlite', '.sqlite3')):
+        return SqliteAuditWriter(path)
+    return JsonlAuditWriter(path)
+
+
+class AuditLog:
+    def __init__(self, path, operator, batch_size=AUDIT_BATCH_SIZE, sync_interval=AUDIT_SYNC_INTERVAL):
+        self.path = path
+        self.operator = operator
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self.queue = queue.SimpleQueue()
+        self.written = 0
+        self.writer_thread = threading.Thread(target=self.run_writer, name='AuditLog', daemon=True)
+        self.writer_thread.start()
+
+    def record(self, tick, sim_time, lane, screw_id, defect_type, decision, outcome):
+        self.queue.put((self.operator, time.time(), tick, sim_time, lane, screw_id, defect_type, decision, outcome))
+
+    def run_writer(self):
+        writer = open_audit_writer(self.path)
+        last_sync = time.monotonic()
+        pending = False
+        stopping = False
+        while not stopping:
+            timeout = max(0.0, self.sync_interval - (time.monotonic() - last_sync)) if pending else None
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            rows = []
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                    break
+                rows.append(item)
+                if len(rows) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            if rows:
+                try:
+                    writer.write(rows)
+                    self.written += len(rows)
+                    pending = True
+                except (OSError, sqlite3.Error) as error:
+                    logger.error(f"Audit log write failed: {error}")
+
+            if pending and (stopping or time.monotonic() - last_sync >= self.sync_interval):
+                try:
+                    writer.sync()
+                except (OSError, sqlite3.Error) as error:
+                    logger.error(f"Audit log sync failed: {error}")
+                last_sync = time.monotonic()
+                pending = False
+        writer.close()
+
+    def close(self, timeout=None):
+        self.queue.put(_STOP)
+        self.writer_thread.join(timeout)
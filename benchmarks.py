@@ -0,0 +1,238 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import numpy as np
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from dirty_rects import present
+from random_streams import RandomStreams
+from telemetry import SystemMonitor, create_source
+from production import ProductionLine
+from game import Game
+from menu_window import MenuWindow
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+BASELINE_PATH = 'benchmark_baseline.json'
+DEFAULT_THRESHOLD = 0.25
+COMPARED_STATS = ('p50', 'p95')
+SCREW_TRAVEL_SECONDS = (SCREEN_WIDTH + 70) / (2 * FPS)
+
+BENCHMARKS = {}
+
+
+def benchmark(name, iterations=600):
+    def register(setup):
+        BENCHMARKS[name] = (setup, iterations)
+        return setup
+    return register
+
+
+def make_screen():
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def make_line(density, seed=0):
+    line = ProductionLine(SystemMonitor(to_show=False), streams=RandomStreams(seed))
+    line.spawn_interval = SCREW_TRAVEL_SECONDS / density
+    for _ in range(int(SCREW_TRAVEL_SECONDS * FPS)):
+        line.step()
+        line.machine_health = 100
+    return line
+
+
+def make_game(seed=0):
+    game = Game('benchmark', create_source(f"synthetic:{seed}"), seed=seed)
+    game.system_monitor.stop()
+    for _ in range(FPS):
+        game.update()
+    return game
+
+
+def keep_healthy(line):
+    line.machine_health = 100
+
+
+def hold_fire(line, intensity):
+    if not line.critical_failure:
+        line.machine_health = 10
+        line.critical_failure = True
+        line.start_fire_simulation()
+    line.fire_start_time = line.time - 3 * (intensity - 1.0) / 0.8
+
+
+def update_case(density):
+    def setup():
+        line = make_line(density)
+
+        def run():
+            line.step()
+            keep_healthy(line)
+        return run
+    return setup
+
+
+for density in (10, 50, 200):
+    benchmark(f"line_update_{density}", iterations=2000)(update_case(density))
+
+
+@benchmark('screw_draw_50')
+def screw_draw():
+    screen = make_screen()
+    line = make_line(50)
+
+    def run():
+        for screw in line.screws:
+            screw.draw(screen)
+    return run
+
+
+@benchmark('line_draw_50')
+def line_draw():
+    screen = make_screen()
+    line = make_line(50)
+
+    def run():
+        line.step()
+        keep_healthy(line)
+        line.draw(screen)
+    return run
+
+
+@benchmark('dashboard')
+def dashboard():
+    game = make_game()
+
+    def run():
+        game.draw_dashboard()
+    return run
+
+
+def frame_case(state):
+    def setup():
+        game = make_game()
+        line = game.production_line
+        iteration = [0]
+
+        def run():
+            game.presence_checker.reset_activity()
+            if state == 'normal':
+                keep_healthy(line)
+            elif state == 'fire':
+                hold_fire(line, 3.0)
+            elif state == 'explosion':
+                if iteration[0] % FPS == 0:
+                    hold_fire(line, 3.0)
+                    line.exploded = False
+                    line.trigger_explosion()
+                line.explosion_time = line.time - 1.0
+            iteration[0] += 1
+            game.update()
+            present(game.draw(), game.use_dirty_rects)
+        return run
+    return setup
+
+
+for state in ('normal', 'fire', 'explosion'):
+    benchmark(f"game_frame_{state}")(frame_case(state))
+
+
+@benchmark('menu_background')
+def menu_background():
+    menu = MenuWindow()
+
+    def run():
+        present(menu.render(), menu.use_dirty_rects)
+    return run
+
+
+def measure(setup, iterations, warmup):
+    run = setup()
+    for _ in range(warmup):
+        run()
+    samples = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        run()
+        samples[i] = time.perf_counter() - start
+    samples *= 1000
+    p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+    return {'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'mean': float(samples.mean()), 'iterations': iterations}
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for stat in COMPARED_STATS:
+            if reference[stat] > 0 and stats[stat] > reference[stat] * (1 + threshold):
+                regressions.append((name, stat, reference[stat], stats[stat]))
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark update and render hot paths headless")
+    parser.add_argument('names', nargs='*', help="benchmarks to run (default: all)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline")
+    parser.add_argument('--scale', type=float, default=1.0, help="multiply iteration counts")
+    parser.add_argument('--warmup', type=int, default=60)
+    parser.add_argument('--list', action='store_true')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    logging.getLogger('ProductionLineSimulator').setLevel(logging.WARNING)
+    baseline = load_baseline(args.baseline) or {}
+    results = {}
+    print(f"{'benchmark':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'base p95':>10}")
+    for name in args.names or BENCHMARKS:
+        setup, iterations = BENCHMARKS[name]
+        stats = measure(setup, max(1, int(iterations * args.scale)), args.warmup)
+        results[name] = stats
+        reference = baseline.get(name, {}).get('p95')
+        reference = f"{reference:.3f}" if reference is not None else "-"
+        print(f"{name:<24}{stats['p50']:>10.3f}{stats['p95']:>10.3f}{stats['p99']:>10.3f}{reference:>10}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump({**baseline, **results}, file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, stat, reference, value in regressions:
+        print(f"REGRESSION {name} {stat}: {value:.3f} ms vs baseline {reference:.3f} ms "
+              f"(+{(value / reference - 1) * 100:.0f}%)")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
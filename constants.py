@@ -1,4 +1,3 @@
-import pygame
 import sys
 import math
 import random
@@ -17,4 +16,4 @@ DARK_GRAY = (50, 50, 50)
 BLUE = (0, 120, 255)
 RED = (255, 50, 50)
 GREEN = (50, 200, 50)
-YELLOW = (255, 255, 0)
\ No newline at end of file
+YELLOW = (255, 255, 0)
@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import hmac
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+USERS_PATH = 'users.json'
+HASH_NAME = 'sha256'
+HASH_ITERATIONS = 200_000
+SALT_BYTES = 16
+UNKNOWN_USER_ENTRY = {'salt': '00' * SALT_BYTES, 'hash': '00' * 32, 'iterations': HASH_ITERATIONS}
+DEFAULT_USERS = (('admin', '1234'), ('user', '5678'))
+
+
+def hash_password(password, salt, iterations=HASH_ITERATIONS):
+    return hashlib.pbkdf2_hmac(HASH_NAME, password.encode(), salt, iterations)
+
+
+def make_entry(username, password, iterations=HASH_ITERATIONS):
+    salt = os.urandom(SALT_BYTES)
+    return {
+        'username': username,
+        'salt': salt.hex(),
+        'hash': hash_password(password, salt, iterations).hex(),
+        'iterations': iterations,
+    }
+
+
+def check_entry(entry, password):
+    if 'hash' not in entry:
+        return hmac.compare_digest(entry.get('password', '').encode(), password.encode())
+    digest = hash_password(password, bytes.fromhex(entry['salt']), entry.get('iterations', HASH_ITERATIONS))
+    return hmac.compare_digest(digest, bytes.fromhex(entry['hash']))
+
+
+class CredentialStore:
+    def __init__(self, path=USERS_PATH):
+        self.path = path
+        self.users = {}
+        self.mtime = None
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def ensure_loaded(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            self.write([make_entry(username, password) for username, password in DEFAULT_USERS])
+            logger.info("Created default user database")
+            mtime = os.stat(self.path).st_mtime_ns
+
+        with self.lock:
+            if mtime == self.mtime:
+                return
+            try:
+                with open(self.path, 'r') as file:
+                    entries = json.load(file).get('users', [])
+                logger.info("User database loaded successfully")
+            except json.JSONDecodeError:
+                logger.error("Invalid JSON format in users database")
+                entries = []
+            self.users = {entry.get('username'): entry for entry in entries}
+            self.mtime = mtime
+
+        plaintext = [username for username, entry in self.users.items() if 'hash' not in entry]
+        if plaintext:
+            logger.warning(f"Plaintext passwords in {self.path} for: {', '.join(plaintext)}")
+
+    def write(self, entries):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as file:
+            json.dump({'users': entries}, file, indent=4)
+        os.replace(temp_path, self.path)
+
+    def verify(self, username, password):
+        self.ensure_loaded()
+        entry = self.users.get(username)
+        if entry is None:
+            check_entry(UNKNOWN_USER_ENTRY, password)
+            return False
+        return check_entry(entry, password)
+
+    def verify_async(self, username, password):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Credentials')
+        return self.executor.submit(self.verify, username, password)
+
+    def set_password(self, username, password):
+        self.ensure_loaded()
+        with self.lock:
+            users = dict(self.users)
+        users[username] = make_entry(username, password)
+        self.write(list(users.values()))
+
+    def migrate(self):
+        self.ensure_loaded()
+        with self.lock:
+            users = dict(self.users)
+        migrated = 0
+        for username, entry in users.items():
+            if 'hash' not in entry:
+                users[username] = make_entry(username, entry.get('password', ''))
+                migrated += 1
+        if migrated:
+            self.write(list(users.values()))
+        return migrated
+
+
+CREDENTIALS = CredentialStore()
+
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] == 'migrate':
+        print(f"Hashed {CREDENTIALS.migrate()} plaintext password(s) in {CREDENTIALS.path}")
+    elif len(sys.argv) == 4 and sys.argv[1] == 'set':
+        CREDENTIALS.set_password(sys.argv[2], sys.argv[3])
+        print(f"Password set for {sys.argv[2]}")
+    else:
+        print("usage: credentials.py migrate | set <username> <password>")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import pygame
+
+
+class DirtyTracker:
+    def __init__(self):
+        self.states = {}
+
+    def changed(self, name, state):
+        if name in self.states and self.states[name] == state:
+            return False
+        self.states[name] = state
+        return True
+
+    def reset(self):
+        self.states.clear()
+
+
+def present(rects, enabled=True):
+    if rects is None or not enabled:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
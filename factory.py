@@ -0,0 +1,135 @@
+import os
+import math
+import time
+import logging
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from simulation import LineGroup, TICK_SECONDS
+from telemetry import SystemMonitor, ReplaySource, create_source
+from random_streams import RandomStreams
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+STAT_FIELDS = ('good_count', 'defective_count', 'missed_defects', 'false_positives')
+
+_scenario = None
+_trace = None
+
+
+def init_worker(scenario, trace):
+    global _scenario, _trace
+    _scenario = scenario
+    _trace = trace
+
+
+def record_trace(scenario):
+    interval = scenario.get('sample_interval', 1.0)
+    source = create_source(scenario.get('telemetry', 'synthetic:0'))
+    samples = math.ceil(scenario['duration'] / interval) + 2
+    try:
+        return np.array([source.read(index * interval) for index in range(samples)], dtype=np.float64)
+    finally:
+        source.close()
+
+
+def build_station(station, scenario, trace):
+    source = ReplaySource(None, records=trace)
+    monitor = SystemMonitor(source=source, sample_interval=scenario.get('sample_interval', 1.0))
+    return LineGroup(monitor, station['speed_multipliers'], streams=RandomStreams(station['seed']))
+
+
+def simulate_station(station, scenario, trace):
+    group = build_station(station, scenario, trace)
+    ticks = int(scenario['duration'] / TICK_SECONDS)
+    for _ in range(ticks):
+        group.step()
+    group.system_monitor.source.close()
+
+    lines = group.production_lines
+    result = {'station_id': station['station_id'], 'lanes': len(lines)}
+    for field in STAT_FIELDS:
+        result[field] = sum(getattr(line, field) for line in lines)
+    result['machine_health'] = [line.machine_health for line in lines]
+    result['critical_failures'] = sum(1 for line in lines if line.critical_failure)
+    return result
+
+
+def run_shard(stations):
+    return [simulate_station(station, _scenario, _trace) for station in stations]
+
+
+def aggregate(results):
+    health = [value for result in results for value in result['machine_health']]
+    stats = {
+        'stations': len(results),
+        'lanes': sum(result['lanes'] for result in results),
+        'critical_failures': sum(result['critical_failures'] for result in results),
+    }
+    for field in STAT_FIELDS:
+        stats[field] = sum(result[field] for result in results)
+    stats['machine_health'] = {
+        'mean': float(np.mean(health)) if health else 0.0,
+        'min': float(np.min(health)) if health else 0.0,
+    }
+    return stats
+
+
+def make_stations(count, lanes_per_station=1, seed=0):
+    return [
+        {
+            'station_id': station_id,
+            'seed': seed + station_id,
+            'speed_multipliers': [1.0] * lanes_per_station,
+        }
+        for station_id in range(count)
+    ]
+
+
+class FactoryRunner:
+    def __init__(self, stations, scenario, workers=None):
+        self.stations = stations
+        self.scenario = scenario
+        self.workers = workers or os.cpu_count() or 1
+
+    def shards(self, workers):
+        return [self.stations[i::workers] for i in range(workers)]
+
+    def run(self):
+        start = time.perf_counter()
+        workers = max(1, min(self.workers, len(self.stations)))
+        trace = record_trace(self.scenario)
+        if workers == 1:
+            init_worker(self.scenario, trace)
+            results = run_shard(self.stations)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                     initargs=(self.scenario, trace)) as pool:
+                results = [result for shard in pool.map(run_shard, self.shards(workers)) for result in shard]
+
+        stats = aggregate(results)
+        stats['workers'] = workers
+        stats['wall_time'] = time.perf_counter() - start
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a plant of headless production stations")
+    parser.add_argument('--stations', type=int, default=16)
+    parser.add_argument('--lanes', type=int, default=1)
+    parser.add_argument('--duration', type=float, default=300.0, help="simulated seconds per station")
+    parser.add_argument('--telemetry', default='synthetic:0')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    logging.getLogger('ProductionLineSimulator').setLevel(logging.WARNING)
+    scenario = {'duration': args.duration, 'telemetry': args.telemetry}
+    stations = make_stations(args.stations, args.lanes, args.seed)
+    stats = FactoryRunner(stations, scenario, args.workers).run()
+    for key, value in stats.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,23 @@ import math
 import random
 import logging
 import json
-import psutil
-import threading
 import time
 from constants import *
+from text_cache import TEXT_CACHE
+from dirty_rects import DirtyTracker, present
+from resources import RESOURCES
+from sparkline import Sparkline
+from profiler import PROFILER
+from profiler_overlay import ProfilerOverlay, PROFILER_KEYS
 from interaction import PresenceChecker
+from app_context import AppContext
+from random_streams import RandomStreams
+from audit import AuditLog
+from session import InputRecorder, INPUT_QUIT, INPUT_KEY, INPUT_CLICK, line_counters
+from telemetry import RecordingSource
 from menu_window import MenuWindow
 from production import ProductionLine, BackgroundProductionLine, SystemMonitor, Screw
+from simulation import WARNING_DURATION, TICK_SECONDS, MAX_CATCH_UP_TICKS
 
 
 logging.basicConfig(
@@ -21,20 +31,43 @@ logging.basicConfig(
 logger = logging.getLogger('ProductionLineSimulator')
 
 class Game:
-    def __init__(self, username):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Production Line Simulator")
-        self.clock = pygame.time.Clock()
-        
-        self.font = pygame.font.SysFont('Arial', 24)
-        self.small_font = pygame.font.SysFont('Arial', 18)
-        self.large_font = pygame.font.SysFont('Arial', 32)
-        self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-        
-        self.system_monitor = SystemMonitor()
-        self.production_line = ProductionLine(self.system_monitor)
-        self.presence_checker = PresenceChecker(self)
+    def __init__(self, username, telemetry_source=None, seed=None, record_path=None, playback=None,
+                 audit_path=None, context=None):
+        self.context = context if context is not None else AppContext()
+        self.screen = self.context.screen
+        self.clock = self.context.clock
+        
+        self.font = RESOURCES.font('Arial', 24)
+        self.small_font = RESOURCES.font('Arial', 18)
+        self.large_font = RESOURCES.font('Arial', 32)
+        self.title_font = RESOURCES.font('Arial', 36, bold=True)
+        RESOURCES.preload_alarm_fonts('Arial')
+        RESOURCES.preload_smoke()
+        
+        if playback is not None:
+            seed = playback.seed
+            telemetry_source = playback.source()
+        self.streams = RandomStreams(seed)
+        self.playback = playback
+        self.recorder = None
+        if record_path is not None:
+            if telemetry_source is None:
+                telemetry_source = self.context.create_source()
+            telemetry_source = RecordingSource(telemetry_source)
+            self.recorder = InputRecorder(record_path, self.streams.seed, telemetry_source)
+        self.tick = 0
+        
+        self.owns_monitor = telemetry_source is not None
+        if self.owns_monitor:
+            self.system_monitor = SystemMonitor(source=telemetry_source)
+        else:
+            self.system_monitor = self.context.system_monitor()
+        self.production_line = ProductionLine(self.system_monitor, streams=self.streams)
+        self.production_line.scene = self.context.scene_layer()
+        self.presence_checker = PresenceChecker(self, self.streams.random('presence'), self.session_clock)
+        if audit_path is not None:
+            self.production_line.audit = AuditLog(audit_path, username)
+        self.session_store = self.context.session_store
         
         self.running = True
         self.paused = False
@@ -48,121 +81,124 @@ class Game:
             'good': pygame.Rect(SCREEN_WIDTH // 2 + 10, 430, 140, 40),
         }
         self.extinguisher_button = pygame.Rect(SCREEN_WIDTH - 150, 150, 120, 50)
+        self.dashboard_rect = pygame.Rect(20, 500, SCREEN_WIDTH - 40, SCREEN_HEIGHT - 500)
+        self.warnings_rect = pygame.Rect(20, SCREEN_HEIGHT - 180, SCREEN_WIDTH - 40, 75)
+        self.warning_surfaces = {}
+        
+        self.sparklines = {
+            'cpu_temp': Sparkline('cpu_temp', (70, 15), color=(255, 150, 50)),
+            'cpu_usage': Sparkline('cpu_usage', (70, 15), color=(100, 100, 200)),
+        }
+        
+        self.use_dirty_rects = True
+        self.dirty_rects = DirtyTracker()
+        self.profiler_overlay = ProfilerOverlay()
         
-        self.monitor_thread = threading.Thread(target=self.monitor_system, daemon=True)
-        self.monitor_thread.start()
+        if self.owns_monitor and self.recorder is None and self.playback is None:
+            self.system_monitor.start()
     
-    def monitor_system(self):
-        while self.running:
-            self.system_monitor.update_system_info()
-            time.sleep(1)
+    def session_clock(self):
+        return self.tick * TICK_SECONDS
     
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
+                self.apply_input(INPUT_QUIT)
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.dirty_rects.reset()
+            elif event.type == pygame.KEYDOWN and event.key in PROFILER_KEYS:
+                self.profiler_overlay.handle_key(event.key)
             elif event.type == pygame.KEYDOWN:
-                if not self.presence_checker.alarm_active:
-                    self.presence_checker.check_confirmation(event.key)
-                
-                if event.key == pygame.K_ESCAPE:
-                    self.paused = not self.paused
-                elif event.key == pygame.K_d:
-                    if not self.paused:
-                        self.production_line.mark_defective()
-                elif event.key == pygame.K_g:
-                    if not self.paused:
-                        self.production_line.mark_good()
-            
+                self.apply_input(INPUT_KEY, event.key)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if not self.presence_checker.alarm_active:
-                    self.presence_checker.reset_activity()
-                
-                mouse_pos = pygame.mouse.get_pos()
-                
-                self.production_line.select_screw(mouse_pos)
-                
-                if self.buttons['defective'].collidepoint(mouse_pos):
+                self.apply_input(INPUT_CLICK, *pygame.mouse.get_pos())
+    
+    def apply_input(self, kind, a=0, b=0):
+        if self.recorder is not None:
+            self.recorder.record(self.tick, kind, a, b)
+        
+        if kind == INPUT_QUIT:
+            self.running = False
+        elif kind == INPUT_KEY:
+            if not self.presence_checker.alarm_active:
+                self.presence_checker.check_confirmation(a)
+            
+            if a == pygame.K_ESCAPE:
+                self.paused = not self.paused
+            elif a == pygame.K_d:
+                if not self.paused:
                     self.production_line.mark_defective()
-                elif self.buttons['good'].collidepoint(mouse_pos):
+            elif a == pygame.K_g:
+                if not self.paused:
                     self.production_line.mark_good()
-                    
-                if self.production_line.critical_failure and self.extinguisher_button.collidepoint(mouse_pos):
-                    if self.production_line.fire_intensity < 4.0:
-                        self.production_line.critical_failure = False
-                        self.production_line.fire_particles = []
-                        self.production_line.machine_health += 20
-                        self.production_line.add_warning("Fire extinguished successfully!")
-                    else:
-                        self.production_line.add_warning("Fire too intense! Cannot extinguish!")
+        
+        elif kind == INPUT_CLICK:
+            if not self.presence_checker.alarm_active:
+                self.presence_checker.reset_activity()
+            
+            mouse_pos = (a, b)
+            
+            self.production_line.select_screw(mouse_pos)
+            
+            if self.buttons['defective'].collidepoint(mouse_pos):
+                self.production_line.mark_defective()
+            elif self.buttons['good'].collidepoint(mouse_pos):
+                self.production_line.mark_good()
+                
+            if self.production_line.critical_failure and self.extinguisher_button.collidepoint(mouse_pos):
+                self.production_line.extinguish_fire()
     
     def update(self):
+        self.tick += 1
         if self.paused:
             return
         
-        system_info = self.system_monitor.update_system_info()
-        
-        current_time = time.time()
-        self.production_line.update(current_time)
+        self.production_line.step()
         
         should_logout = self.presence_checker.update()
         if should_logout:
             self.running = False
             logger.warning(f"User {self.username} logged out due to inactivity")
         
-        self.score = (self.production_line.good_count * 10 + 
-                     self.production_line.defective_count * 20 - 
-                     self.production_line.missed_defects * 15 -
-                     self.production_line.false_positives * 10)
-        
-        total_inspected = self.production_line.good_count + self.production_line.defective_count
-        self.level = 1 + total_inspected // 20
-        
-        if self.level > 1:
-            target_rate = min(1.0 + (self.level - 1) * 0.1, 2.0)
-            self.production_line.production_rate = min(target_rate, self.production_line.production_rate + 0.01)
-            logger.info(f"Level up to {self.level}! Production speed: {self.production_line.production_rate:.1f}x")
+        self.score = self.production_line.score
+        self.level = self.production_line.level
     
     def draw_fire_alarm(self):
         if self.production_line.critical_failure:
             flash_intensity = (math.sin(time.time() * 10) + 1) / 2
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 0, 0, int(100 * flash_intensity)))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(RESOURCES.overlay((255, 0, 0), int(100 * flash_intensity)), (0, 0))
             
             pulse_size = int(36 + flash_intensity * 8)
-            alarm_font = pygame.font.SysFont('Arial', pulse_size, bold=True)
-            alarm_text = alarm_font.render("CRITICAL FAILURE - FIRE DETECTED", True, (255, 255, 0))
+            alarm_font = RESOURCES.font('Arial', pulse_size, bold=True)
+            alarm_text = TEXT_CACHE.render(alarm_font, "CRITICAL FAILURE - FIRE DETECTED", True, (255, 255, 0))
             alarm_rect = alarm_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
             self.screen.blit(alarm_text, alarm_rect)
 
             if self.production_line.critical_failure:
                 pygame.draw.rect(self.screen, (200, 50, 50), self.extinguisher_button)
                 pygame.draw.rect(self.screen, (150, 30, 30), self.extinguisher_button, 3)
-                extinguisher_text = self.font.render("EXTINGUISH", True, WHITE)
+                extinguisher_text = TEXT_CACHE.render(self.font, "EXTINGUISH", True, WHITE)
                 extinguisher_rect = extinguisher_text.get_rect(center=self.extinguisher_button.center)
                 self.screen.blit(extinguisher_text, extinguisher_rect)
             
             self.draw_text("EMERGENCY PROCEDURES ACTIVATED", SCREEN_WIDTH // 2 - 200, 200, color=(255, 200, 0))
             self.draw_text("SYSTEM WILL SHUT DOWN AUTOMATICALLY", SCREEN_WIDTH // 2 - 220, 230, color=(255, 200, 0))
 
-            if hasattr(self.production_line, 'exploded') and self.production_line.exploded:
-                time_since_explosion = time.time() - self.production_line.explosion_time
+            if self.production_line.exploded:
+                time_since_explosion = self.production_line.time - self.production_line.explosion_time
                 
                 if time_since_explosion < 3.0:
                     flash_alpha = max(0, 255 - int(time_since_explosion * 85))
-                    flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                    
                     if time_since_explosion < 0.2:
-                        flash_surface.fill((255, 255, 255, flash_alpha))
+                        flash_surface = RESOURCES.overlay((255, 255, 255), flash_alpha)
                     else:
-                        flash_surface.fill((255, 0, 0, flash_alpha))
+                        flash_surface = RESOURCES.overlay((255, 0, 0), flash_alpha)
                         
                     self.screen.blit(flash_surface, (0, 0))
                     
                     explosion_size = int(72 * (1 - time_since_explosion/3))
-                    explosion_font = pygame.font.SysFont('Arial', explosion_size, bold=True)
-                    explosion_text = explosion_font.render("CATASTROPHIC FAILURE", True, (255, 255, 0))
+                    explosion_font = RESOURCES.explosion_font('Arial', explosion_size)
+                    explosion_text = TEXT_CACHE.render(explosion_font, "CATASTROPHIC FAILURE", True, (255, 255, 0))
                     text_rect = explosion_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
                     self.screen.blit(explosion_text, text_rect)
     
@@ -175,8 +211,9 @@ class Game:
         
         self.draw_text("SYSTEM DIAGNOSTICS", metrics_rect.x + 10, metrics_rect.y + 10, color=(200, 200, 255))
         
+        snapshot = self.system_monitor.snapshot
         temp_y = metrics_rect.y + 50
-        self.draw_text(f"CPU Temp: {self.system_monitor.cpu_temp:.1f}°C", 
+        self.draw_text(f"CPU Temp: {snapshot.cpu_temp:.1f}°C", 
                       metrics_rect.x + 10, temp_y, small=True)
         
         bar_width = 200
@@ -185,7 +222,7 @@ class Game:
         bar_y = temp_y + 20
         pygame.draw.rect(self.screen, (50, 50, 70), (bar_x, bar_y, bar_width, bar_height))
         
-        temp_ratio = min(1.0, max(0.0, self.system_monitor.cpu_temp / 100))
+        temp_ratio = min(1.0, max(0.0, snapshot.cpu_temp / 100))
         temp_width = int(bar_width * temp_ratio)
         
         if temp_ratio < 0.5:
@@ -197,22 +234,24 @@ class Game:
         temp_color = (r, g, 0)
         
         pygame.draw.rect(self.screen, temp_color, (bar_x, bar_y, temp_width, bar_height))
+        self.sparklines['cpu_temp'].draw(self.screen, self.system_monitor.history, (bar_x + bar_width + 10, bar_y))
         
         usage_y = bar_y + 30
-        self.draw_text(f"CPU Usage: {self.system_monitor.cpu_usage:.1f}%", 
+        self.draw_text(f"CPU Usage: {snapshot.cpu_usage:.1f}%", 
                       metrics_rect.x + 10, usage_y, small=True)
         
         usage_bar_y = usage_y + 20
         pygame.draw.rect(self.screen, (50, 50, 70), (bar_x, usage_bar_y, bar_width, bar_height))
-        usage_width = int(bar_width * self.system_monitor.cpu_usage / 100)
+        usage_width = int(bar_width * snapshot.cpu_usage / 100)
         pygame.draw.rect(self.screen, (100, 100, 200), (bar_x, usage_bar_y, usage_width, bar_height))
+        self.sparklines['cpu_usage'].draw(self.screen, self.system_monitor.history, (bar_x + bar_width + 10, usage_bar_y))
         
         fan_y = usage_bar_y + 30
-        self.draw_text(f"Fan Speed: {self.system_monitor.fan_speed} RPM", 
+        self.draw_text(f"Fan Speed: {snapshot.fan_speed} RPM", 
                       metrics_rect.x + 10, fan_y, small=True)
         
         ram_y = fan_y + 25
-        self.draw_text(f"RAM Usage: {self.system_monitor.ram_usage:.1f}%", 
+        self.draw_text(f"RAM Usage: {snapshot.ram_usage:.1f}%", 
                       metrics_rect.x + 10, ram_y, small=True)
         
         stats_rect = pygame.Rect(metrics_rect.right + 20, panel_rect.y + 20, 300, 210)
@@ -268,10 +307,10 @@ class Game:
         pygame.draw.rect(self.screen, (30, 30, 50), score_rect)
         pygame.draw.rect(self.screen, (80, 80, 120), score_rect, 2)
         
-        score_text = self.large_font.render(f"SCORE: {self.score}", True, (200, 200, 255))
+        score_text = TEXT_CACHE.render(self.large_font, f"SCORE: {self.score}", True, (200, 200, 255))
         self.screen.blit(score_text, (score_rect.x + 20, score_rect.y + 20))
         
-        level_text = self.large_font.render(f"LEVEL: {self.level}", True, (200, 200, 255))
+        level_text = TEXT_CACHE.render(self.large_font, f"LEVEL: {self.level}", True, (200, 200, 255))
         self.screen.blit(level_text, (score_rect.x + 20, score_rect.y + 60))
         
         user_rect = pygame.Rect(score_rect.x, score_rect.bottom + 10, 
@@ -298,37 +337,66 @@ class Game:
         self.draw_text("INSTRUCTIONS: Click on defective screws to remove them from the production line",
                 instr_rect.x + 20, instr_rect.y + 10, small=True)
     
+    def dashboard_state(self):
+        monitor = self.system_monitor
+        snapshot = monitor.snapshot
+        line = self.production_line
+        return (
+            f"{snapshot.cpu_temp:.1f}", f"{snapshot.cpu_usage:.1f}", snapshot.fan_speed, f"{snapshot.ram_usage:.1f}",
+            monitor.history.total,
+            line.good_count, line.defective_count, line.missed_defects, line.false_positives,
+            line.machine_status, int(200 * line.machine_health / 100),
+            self.score, self.level, int(time.time() - self.start_time), f"{line.production_rate:.2f}",
+        )
+    
+    def warning_alpha(self, warning):
+        age = self.production_line.time - warning.time
+        return max(0, int(255 * (1 - age / WARNING_DURATION))) & ~0xF
+
+    def warnings_state(self):
+        return tuple(
+            (warning.text, self.warning_alpha(warning))
+            for warning in self.production_line.warning_messages.latest(3)
+        )
+    
+    def warning_surface(self, warning):
+        shown = (warning.message, warning.shown_count)
+        cached = self.warning_surfaces.get(warning.key)
+        if cached is None or cached[0] != shown:
+            if len(self.warning_surfaces) > 2 * self.production_line.warning_messages.capacity:
+                active = self.production_line.warning_messages.active
+                self.warning_surfaces = {key: value for key, value in self.warning_surfaces.items()
+                                         if key in active}
+            cached = (shown, self.small_font.render(warning.text, True, (255, 200, 50)))
+            self.warning_surfaces[warning.key] = cached
+        return cached[1]
+
     def draw_warning_messages(self):
-        for i, warning in enumerate(self.production_line.warning_messages[-3:]):
-            age = pygame.time.get_ticks() - warning['time']
-            alpha = int(255 * (1 - age / 5000))
-            
-            warning_surface = self.small_font.render(warning['message'], True, (255, 200, 50))
-            warning_surface.set_alpha(alpha)
+        for i, warning in enumerate(self.production_line.warning_messages.latest(3)):
+            warning_surface = self.warning_surface(warning)
+            warning_surface.set_alpha(self.warning_alpha(warning))
             self.screen.blit(warning_surface, (20, SCREEN_HEIGHT - 180 + i * 25))
     
     def draw_presence_warning(self):
         if self.presence_checker.warning_shown:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(RESOURCES.overlay((0, 0, 0), 150), (0, 0))
             
             warning_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 100, 400, 200)
             pygame.draw.rect(self.screen, (50, 50, 70), warning_rect)
             pygame.draw.rect(self.screen, (200, 50, 50), warning_rect, 3)
             
-            warning_title = self.large_font.render("ATTENTION REQUIRED", True, (255, 100, 100))
+            warning_title = TEXT_CACHE.render(self.large_font, "ATTENTION REQUIRED", True, (255, 100, 100))
             warning_title_rect = warning_title.get_rect(center=(SCREEN_WIDTH // 2, warning_rect.y + 40))
             self.screen.blit(warning_title, warning_title_rect)
             
-            key_text = self.font.render(f"Press '{self.presence_checker.required_key}' to confirm presence", 
+            key_text = TEXT_CACHE.render(self.font, f"Press '{self.presence_checker.required_key}' to confirm presence", 
                                       True, WHITE)
             key_rect = key_text.get_rect(center=(SCREEN_WIDTH // 2, warning_rect.y + 100))
             self.screen.blit(key_text, key_rect)
             
             countdown = int(self.presence_checker.check_interval - 
-                          (time.time() - self.presence_checker.last_activity_time))
-            count_text = self.font.render(f"System logout in: {countdown} seconds", True, 
+                          (self.presence_checker.clock() - self.presence_checker.last_activity_time))
+            count_text = TEXT_CACHE.render(self.font, f"System logout in: {countdown} seconds", True, 
                                         (255, 150, 150))
             count_rect = count_text.get_rect(center=(SCREEN_WIDTH // 2, warning_rect.y + 150))
             self.screen.blit(count_text, count_rect)
@@ -336,15 +404,13 @@ class Game:
     def draw_alarm(self):
         if self.presence_checker.alarm_active:
             flash_intensity = (math.sin(time.time() * 10) + 1) / 2
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 0, 0, int(100 * flash_intensity)))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(RESOURCES.overlay((255, 0, 0), int(100 * flash_intensity)), (0, 0))
             
-            alarm_text = self.title_font.render("OPERATOR ABSENCE DETECTED", True, WHITE)
+            alarm_text = TEXT_CACHE.render(self.title_font, "OPERATOR ABSENCE DETECTED", True, WHITE)
             alarm_rect = alarm_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
             self.screen.blit(alarm_text, alarm_rect)
             
-            logout_text = self.large_font.render("Logging out...", True, WHITE)
+            logout_text = TEXT_CACHE.render(self.large_font, "Logging out...", True, WHITE)
             logout_rect = logout_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
             self.screen.blit(logout_text, logout_rect)
     
@@ -352,16 +418,18 @@ class Game:
         if color is None:
             color = (0, 255, 0) if selected else (255, 255, 255)
         font = self.small_font if small else self.font
-        rendered = font.render(text, True, color)
+        rendered = TEXT_CACHE.render(font, text, True, color)
         self.screen.blit(rendered, (x, y))
         return rendered
     
     def draw(self):
-        self.screen.fill((20, 20, 35))
-        
-        self.production_line.draw(self.screen)
+        started = PROFILER.start()
+        dirty = self.production_line.draw(self.screen)
+        PROFILER.stop('draw/line', started)
         
+        started = PROFILER.start()
         self.draw_dashboard()
+        PROFILER.stop('draw/dashboard', started)
         
         self.draw_warning_messages()
 
@@ -372,24 +440,99 @@ class Game:
         self.draw_alarm()
         
         if self.paused:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(RESOURCES.overlay((0, 0, 0), 150), (0, 0))
             
-            pause_text = self.title_font.render("PAUSED", True, WHITE)
+            pause_text = TEXT_CACHE.render(self.title_font, "PAUSED", True, WHITE)
             pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             self.screen.blit(pause_text, pause_rect)
             
-            resume_text = self.font.render("Press ESC to resume", True, WHITE)
+            resume_text = TEXT_CACHE.render(self.font, "Press ESC to resume", True, WHITE)
             resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
             self.screen.blit(resume_text, resume_rect)
+        
+        if self.profiler_overlay.visible:
+            dirty.append(self.profiler_overlay.draw(self.screen))
+        
+        overlay_active = (self.paused or self.production_line.critical_failure or
+                          self.presence_checker.warning_shown or self.presence_checker.alarm_active)
+        if self.dirty_rects.changed('overlay', overlay_active) or overlay_active:
+            return None
+        if self.dirty_rects.changed('profiler', self.profiler_overlay.visible):
+            return None
+        
+        if self.dirty_rects.changed('dashboard', self.dashboard_state()):
+            dirty.append(self.dashboard_rect)
+        if self.dirty_rects.changed('warnings', self.warnings_state()):
+            dirty.append(self.warnings_rect)
+        return dirty
     
     def run(self):
+        accumulator = 0.0
+        previous_time = time.perf_counter()
         while self.running:
+            PROFILER.begin_frame()
+            current_time = time.perf_counter()
+            accumulator += current_time - previous_time
+            previous_time = current_time
+
+            started = PROFILER.start()
             self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
+            PROFILER.stop('events', started)
+
+            started = PROFILER.start()
+            ticks = 0
+            while accumulator >= TICK_SECONDS and ticks < MAX_CATCH_UP_TICKS:
+                self.update()
+                accumulator -= TICK_SECONDS
+                ticks += 1
+            if ticks == MAX_CATCH_UP_TICKS:
+                accumulator = min(accumulator, TICK_SECONDS)
+            PROFILER.stop('update', started)
+
+            started = PROFILER.start()
+            rects = self.draw()
+            PROFILER.stop('draw', started)
+
+            started = PROFILER.start()
+            present(rects, self.use_dirty_rects)
+            PROFILER.stop('present', started)
+
+            started = PROFILER.start()
             self.clock.tick(FPS)
-        
+            PROFILER.stop('idle', started)
+            PROFILER.end_frame()
+        
+        if self.owns_monitor:
+            self.system_monitor.stop()
+            self.system_monitor.source.close()
+        if self.production_line.audit is not None:
+            self.production_line.audit.close()
+        if self.session_store is not None:
+            self.session_store.record(self.session_summary())
+        if self.recorder is not None:
+            self.recorder.save(self.tick, line_counters(self.production_line))
         return "logout"
+    
+    def session_summary(self):
+        ended_at = time.time()
+        return {
+            'operator': self.username,
+            'started_at': self.start_time,
+            'ended_at': ended_at,
+            'duration': ended_at - self.start_time,
+            **line_counters(self.production_line),
+        }
+    
+    def replay(self, render=False):
+        playback = self.playback
+        while self.tick < playback.ticks:
+            for event in playback.due(self.tick):
+                self.apply_input(*event)
+            self.update()
+            if render:
+                present(self.draw(), self.use_dirty_rects)
+        for event in playback.due(self.tick):
+            self.apply_input(*event)
+        
+        self.system_monitor.source.close()
+        return line_counters(self.production_line)
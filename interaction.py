@@ -3,13 +3,15 @@ import time
 import random
 
 class PresenceChecker:
-    def __init__(self, game):
+    def __init__(self, game, rng=None, clock=time.time):
         self.game = game
-        self.last_activity_time = time.time()
+        self.rng = rng if rng is not None else random.Random()
+        self.clock = clock
+        self.last_activity_time = self.clock()
         self.check_interval = 30
         self.warning_time = 20
         self.warning_shown = False
-        self.confirmation_key = random.choice([pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_f])
+        self.confirmation_key = self.rng.choice([pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_f])
         self.confirmation_keys = {
             pygame.K_a: "A",
             pygame.K_s: "S",
@@ -20,7 +22,7 @@ class PresenceChecker:
         self.alarm_active = False
     
     def update(self):
-        current_time = time.time()
+        current_time = self.clock()
         inactive_time = current_time - self.last_activity_time
         
         if inactive_time > self.check_interval:
@@ -29,13 +31,13 @@ class PresenceChecker:
         
         elif inactive_time > self.warning_time and not self.warning_shown:
             self.warning_shown = True
-            self.confirmation_key = random.choice(list(self.confirmation_keys.keys()))
+            self.confirmation_key = self.rng.choice(list(self.confirmation_keys.keys()))
             self.required_key = self.confirmation_keys[self.confirmation_key]
         
         return False
     
     def reset_activity(self):
-        self.last_activity_time = time.time()
+        self.last_activity_time = self.clock()
         self.warning_shown = False
         self.alarm_active = False
     
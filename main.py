@@ -1,8 +1,10 @@
-import pygame
+from startup import STARTUP
+import os
 import sys
 import logging
-from game import Game
 from menu_window import MenuWindow
+from app_context import AppContext
+from session_history import SessionStore, SESSION_DB
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,15 +15,21 @@ logger = logging.getLogger('ProductionLineSimulator')
 
 
 def main():
-    pygame.init()
-    pygame.display.set_caption("Production Line Simulator")
+    STARTUP.mark('imports')
+    session_store = SessionStore(os.environ.get('SESSION_DB', SESSION_DB))
+    context = AppContext(os.environ.get('TELEMETRY_SOURCE', 'psutil'), session_store)
+    STARTUP.mark('display')
     
     while True:
-        menu = MenuWindow()
+        menu = MenuWindow(context)
         menu.menu_loop()
         
         if menu.authenticate_user():
-            game = Game(menu.login_input)
+            from game import Game
+            seed = os.environ.get('SESSION_SEED')
+            game = Game(menu.login_input, seed=int(seed) if seed else None,
+                        record_path=os.environ.get('RECORD_SESSION'), audit_path=os.environ.get('AUDIT_LOG'),
+                        context=context)
             result = game.run()
             
             if result == "logout":
@@ -32,7 +40,7 @@ def main():
         else:
             break
     
-    pygame.quit()
+    context.close()
     sys.exit()
 
 if __name__ == "__main__":
@@ -1,7 +1,14 @@
 import pygame
 from production import ProductionLine, BackgroundProductionLine, Screw
 from constants import *
-import json
+from text_cache import TEXT_CACHE
+from dirty_rects import DirtyTracker, present
+from resources import RESOURCES
+from credentials import CREDENTIALS
+from app_context import AppContext
+from startup import STARTUP
+from profiler import PROFILER
+from profiler_overlay import ProfilerOverlay, PROFILER_KEYS
 import time
 
 logging.basicConfig(
@@ -13,16 +20,17 @@ logger = logging.getLogger('ProductionLineSimulator')
 
 
 class MenuWindow:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Production Line Simulator")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont('Arial', 24)
-        self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-        self.small_font = pygame.font.SysFont('Arial', 18)
+    def __init__(self, context=None):
+        self.context = context if context is not None else AppContext()
+        self.screen = self.context.screen
+        self.clock = self.context.clock
+        self.font = RESOURCES.font('Arial', 24)
+        self.title_font = RESOURCES.font('Arial', 36, bold=True)
+        self.small_font = RESOURCES.font('Arial', 18)
 
-        self.background = BackgroundProductionLine()
+        self.background = self.context.background_line()
+        self.leaderboard = self.context.leaderboard
+        self.leaderboard_rect = pygame.Rect(SCREEN_WIDTH - 300, SCREEN_HEIGHT // 2 - 90, 260, 180)
 
         self.error_message = ""
         self.active_input = ""
@@ -30,30 +38,19 @@ class MenuWindow:
         self.password_input = ""
         self.show_password = False
         
-        self.load_user_database()
+        self.credentials = CREDENTIALS
+        self.credentials.ensure_loaded()
+        self.pending_login = None
+        self.authenticated = False
 
         self.running = True
         self.config = None
+        
+        self.use_dirty_rects = True
+        self.dirty_rects = DirtyTracker()
+        self.profiler_overlay = ProfilerOverlay()
+        STARTUP.mark('menu')
     
-    def load_user_database(self):
-        try:
-            with open('users.json', 'r') as file:
-                self.user_database = json.load(file)
-            logger.info("User database loaded successfully")
-        except FileNotFoundError:
-            self.user_database = {
-                "users": [
-                    {"username": "admin", "password": "1234"},
-                    {"username": "user", "password": "5678"}
-                ]
-            }
-            with open('users.json', 'w') as file:
-                json.dump(self.user_database, file, indent=4)
-            logger.info("Created default user database")
-        except json.JSONDecodeError:
-            logger.error("Invalid JSON format in users database")
-            self.user_database = {"users": []}
-
     def create_background(self):
         gradient_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
@@ -79,35 +76,50 @@ class MenuWindow:
         if color is None:
             color = (0, 255, 0) if selected else (255, 255, 255)
         font = self.small_font if small else self.font
-        rendered = font.render(text, True, color)
+        rendered = TEXT_CACHE.render(font, text, True, color)
         self.screen.blit(rendered, (x, y))
         return rendered
     
     def authenticate_user(self):
-        for user in self.user_database.get("users", []):
-            if user.get("username") == self.login_input and user.get("password") == self.password_input:
-                logger.info(f"User {self.login_input} authenticated successfully")
-                return True
-        return False
+        return self.authenticated
+    
+    def start_login(self):
+        if self.pending_login is None:
+            self.pending_login = self.credentials.verify_async(self.login_input, self.password_input)
+            self.error_message = ""
+    
+    def check_login(self):
+        if self.pending_login is None or not self.pending_login.done():
+            return
+        self.authenticated = self.pending_login.result()
+        self.pending_login = None
+        if self.authenticated:
+            logger.info(f"User {self.login_input} authenticated successfully")
+            logger.info("Starting game...")
+            self.running = False
+        else:
+            self.error_message = "Invalid username or password!"
+            logger.warning(f"Failed login attempt: {self.login_input}")
     
     def render(self):
-        current_time = time.time()
-        self.background.update(current_time)
-        self.background.draw(self.screen)
+        started = PROFILER.start()
+        self.background.step()
+        PROFILER.stop('update', started)
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        self.screen.blit(overlay, (0, 0))
+        started = PROFILER.start()
+        dirty = self.background.draw(self.screen)
+        PROFILER.stop('draw/background', started)
+
+        self.screen.blit(RESOURCES.overlay((0, 0, 0), 100), (0, 0))
 
         title_text = "PRODUCTION LINE SIMULATOR"
-        title_surface = self.title_font.render(title_text, True, (180, 200, 255))
+        title_surface = TEXT_CACHE.render(self.title_font, title_text, True, (180, 200, 255))
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
 
-        glow_surface = pygame.Surface((title_rect.width + 20, title_rect.height + 20), pygame.SRCALPHA)
         pulse = (math.sin(pygame.time.get_ticks() * 0.003) + 1) / 2
-        glow_color = (100, 120, 255, int(100 + pulse * 100))
-        pygame.draw.rect(glow_surface, glow_color, (10, 10, title_rect.width, title_rect.height), 5)
-        self.screen.blit(glow_surface, (title_rect.x - 10, title_rect.y - 10))
+        glow_surface = RESOURCES.outline((100, 120, 255), title_rect.size, 5, int(100 + pulse * 100))
+        self.screen.blit(glow_surface, title_rect)
+        dirty.append(title_rect.inflate(20, 20))
 
         self.screen.blit(title_surface, title_rect)
 
@@ -120,8 +132,7 @@ class MenuWindow:
             panel_height
         )
         
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel_surface.fill((30, 30, 60, 180))
+        panel_surface = RESOURCES.overlay((30, 30, 60), 180, (panel_width, panel_height))
         self.screen.blit(panel_surface, panel_rect)
         pygame.draw.rect(self.screen, (100, 100, 200), panel_rect, 2)
 
@@ -159,29 +170,65 @@ class MenuWindow:
         self.password_box_rect = password_box_rect
         self.checkbox_rect = checkbox_rect
 
-        help_surface = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA)
-        help_surface.fill((0, 0, 0, 150))
+        help_surface = RESOURCES.overlay((0, 0, 0), 150, (SCREEN_WIDTH, 80))
         self.screen.blit(help_surface, (0, SCREEN_HEIGHT - 80))
 
         self.draw_text("ENTER = Login", 50, SCREEN_HEIGHT - 70, small=True)
         self.draw_text("TAB = Switch between fields", 50, SCREEN_HEIGHT - 45, small=True)
                            
         if self.error_message:
-            error_bg = pygame.Surface((300, 40), pygame.SRCALPHA)
-            error_bg.fill((100, 0, 0, 180))
+            error_bg = RESOURCES.overlay((100, 0, 0), 180, (300, 40))
             error_rect = error_bg.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
             self.screen.blit(error_bg, error_rect)
 
-            error_text = self.small_font.render(self.error_message, True, (255, 150, 150))
+            error_text = TEXT_CACHE.render(self.small_font, self.error_message, True, (255, 150, 150))
             error_text_rect = error_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
             self.screen.blit(error_text, error_text_rect)
 
+        if self.leaderboard is not None:
+            rows = self.leaderboard.get()
+            self.draw_leaderboard(rows)
+            if self.dirty_rects.changed('leaderboard', rows):
+                dirty.append(self.leaderboard_rect)
+
+        if self.profiler_overlay.visible:
+            dirty.append(self.profiler_overlay.draw(self.screen))
+
+        if self.dirty_rects.changed('frame', True):
+            return None
+        if self.dirty_rects.changed('profiler', self.profiler_overlay.visible):
+            return None
+        if self.dirty_rects.changed('error', self.error_message):
+            dirty.append(pygame.Rect(0, SCREEN_HEIGHT - 80, SCREEN_WIDTH, 80))
+        return dirty
+
+    def draw_leaderboard(self, rows):
+        rect = self.leaderboard_rect
+        self.screen.blit(RESOURCES.overlay((30, 30, 60), 180, rect.size), rect)
+        pygame.draw.rect(self.screen, (100, 100, 200), rect, 2)
+        self.draw_text("TOP OPERATORS", rect.x + 15, rect.y + 10, color=(180, 200, 255))
+
+        if rows is None:
+            self.draw_text("Loading...", rect.x + 15, rect.y + 45, small=True, color=(150, 150, 180))
+            return
+        if not rows:
+            self.draw_text("No sessions yet", rect.x + 15, rect.y + 45, small=True, color=(150, 150, 180))
+            return
+        for i, (operator, score, level, sessions) in enumerate(rows):
+            y = rect.y + 45 + i * 25
+            self.draw_text(f"{i + 1}. {operator}", rect.x + 15, y, small=True)
+            self.draw_text(f"{score}  L{level}", rect.x + 170, y, small=True, color=(200, 200, 255))
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 logger.info("Menu closed.")
                 pygame.quit()
                 sys.exit()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.dirty_rects.reset()
+            elif event.type == pygame.KEYDOWN and event.key in PROFILER_KEYS:
+                self.profiler_overlay.handle_key(event.key)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_TAB:
                     if self.active_input == "login":
@@ -189,13 +236,7 @@ class MenuWindow:
                     elif self.active_input == "password" or self.active_input is None:
                         self.active_input = "login"
                 elif event.key == pygame.K_RETURN:
-                    if self.authenticate_user():
-                        logger.info("Starting game...")
-                        self.error_message = ""
-                        self.running = False
-                    else:
-                        self.error_message = "Invalid username or password!"
-                        logger.warning(f"Failed login attempt: {self.login_input}")
+                    self.start_login()
                 elif self.active_input:
                     if event.key == pygame.K_BACKSPACE:
                         if self.active_input == "login":
@@ -222,7 +263,22 @@ class MenuWindow:
 
     def menu_loop(self):
         while self.running:
+            PROFILER.begin_frame()
+            started = PROFILER.start()
             self.handle_events()
-            self.render()
-            pygame.display.flip()
+            self.check_login()
+            PROFILER.stop('events', started)
+
+            started = PROFILER.start()
+            rects = self.render()
+            PROFILER.stop('render', started)
+
+            started = PROFILER.start()
+            present(rects, self.use_dirty_rects)
+            PROFILER.stop('present', started)
+            STARTUP.report()
+
+            started = PROFILER.start()
             self.clock.tick(FPS)
+            PROFILER.stop('idle', started)
+            PROFILER.end_frame()
@@ -0,0 +1,96 @@
+import heapq
+from collections import OrderedDict
+
+NOTIFICATION_CAPACITY = 8
+NOTIFICATION_DURATION = 5.0
+NOTIFICATION_MIN_INTERVAL = 0.5
+
+
+class Notification:
+    __slots__ = ('key', 'message', 'count', 'shown_count', 'time', 'expires', 'pending')
+
+    def __init__(self, key, message, now, duration):
+        self.key = key
+        self.message = message
+        self.count = 1
+        self.shown_count = 1
+        self.time = now
+        self.expires = now + duration
+        self.pending = None
+
+    @property
+    def text(self):
+        if self.shown_count == 1:
+            return self.message
+        return f"{self.message} ×{self.shown_count}"
+
+
+class NotificationRing:
+    def __init__(self, capacity=NOTIFICATION_CAPACITY, duration=NOTIFICATION_DURATION,
+                 min_interval=NOTIFICATION_MIN_INTERVAL, rate_limits=None):
+        self.capacity = capacity
+        self.duration = duration
+        self.min_interval = min_interval
+        self.rate_limits = rate_limits or {}
+        self.active = OrderedDict()
+        self.expiry = []
+        self.version = 0
+
+    def __len__(self):
+        return len(self.active)
+
+    def push(self, message, now, key=None):
+        key = message if key is None else key
+        notification = self.active.get(key)
+        if notification is None:
+            if len(self.active) >= self.capacity:
+                self.active.popitem(last=False)
+            notification = Notification(key, message, now, self.duration)
+            self.active[key] = notification
+            self.schedule(notification)
+            return notification
+
+        notification.count += 1
+        if now - notification.time < self.rate_limits.get(key, self.min_interval):
+            notification.pending = now
+        else:
+            self.refresh(notification, now)
+        return notification
+
+    def refresh(self, notification, now):
+        notification.shown_count = notification.count
+        notification.time = now
+        notification.expires = now + self.duration
+        notification.pending = None
+        self.active.move_to_end(notification.key)
+        self.schedule(notification)
+
+    def schedule(self, notification):
+        heapq.heappush(self.expiry, (notification.expires, notification.key))
+        self.version += 1
+        if len(self.expiry) > 4 * self.capacity:
+            self.expiry = [(item.expires, key) for key, item in self.active.items()]
+            heapq.heapify(self.expiry)
+
+    def update(self, now):
+        for notification in list(self.active.values()):
+            if (notification.pending is not None and
+                    now - notification.time >= self.rate_limits.get(notification.key, self.min_interval)):
+                self.refresh(notification, notification.pending)
+
+        expiry = self.expiry
+        while expiry and expiry[0][0] <= now:
+            expires, key = heapq.heappop(expiry)
+            notification = self.active.get(key)
+            if notification is not None and notification.expires == expires:
+                del self.active[key]
+                self.version += 1
+
+    def latest(self, n):
+        notifications = list(self.active.values())
+        return notifications[-n:]
+
+    def clear(self):
+        self.active.clear()
+        self.expiry.clear()
+        self.version += 1
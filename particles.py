@@ -0,0 +1,66 @@
+import numpy as np
+
+MAX_PARTICLES = 2048
+GRAVITY = 0.05
+
+PARTICLE_COLORS = ((255, 50, 0), (255, 150, 0), (200, 200, 0), (255, 255, 0))
+FIRE_COLORS = np.array([0, 1, 2], dtype=np.int8)
+EXPLOSION_COLORS = np.array([0, 1, 3], dtype=np.int8)
+
+PARTICLE_FIELDS = {
+    'x': np.float32,
+    'y': np.float32,
+    'vx': np.float32,
+    'vy': np.float32,
+    'size': np.int16,
+    'color': np.int8,
+    'life': np.float32,
+}
+
+
+class ParticlePool:
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        for name, dtype in PARTICLE_FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, vx, vy, size, color, life):
+        added = min(len(x), self.capacity - self.count)
+        if added <= 0:
+            return 0
+        start = self.count
+        end = start + added
+        self.x[start:end] = x[:added]
+        self.y[start:end] = y[:added]
+        self.vx[start:end] = vx[:added]
+        self.vy[start:end] = vy[:added]
+        self.size[start:end] = size[:added]
+        self.color[start:end] = color[:added]
+        self.life[start:end] = life[:added]
+        self.count = end
+        return added
+
+    def update(self, frames):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * frames
+        self.y[:n] += self.vy[:n] * frames
+        self.vy[:n] += GRAVITY * frames
+        self.life[:n] -= frames
+
+        alive = self.life[:n] > 0
+        kept = int(np.count_nonzero(alive))
+        if kept == n:
+            return
+        for name in PARTICLE_FIELDS:
+            column = getattr(self, name)
+            column[:kept] = column[:n][alive]
+        self.count = kept
+
+    def clear(self):
+        self.count = 0
@@ -0,0 +1,122 @@
+import json
+import time
+import threading
+import numpy as np
+from collections import deque
+
+PROFILE_CAPACITY = 600
+TRACE_CAPACITY = 50000
+HISTOGRAM_EDGES_MS = (0, 0.25, 0.5, 1, 2, 4, 8, 16.7, 33.3, 66.7, float('inf'))
+
+
+class FrameProfiler:
+    def __init__(self, capacity=PROFILE_CAPACITY, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.frame_times = np.zeros(capacity)
+        self.phases = {}
+        self.head = 0
+        self.count = 0
+        self.total = 0
+        self.frame_start = None
+        self.current = {}
+        self.spans = deque(maxlen=TRACE_CAPACITY)
+        self.lock = threading.Lock()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frame_start = None
+        return self.enabled
+
+    def start(self):
+        if not self.enabled:
+            return 0.0
+        return time.perf_counter()
+
+    def stop(self, name, started):
+        if self.enabled and started:
+            self.record(name, started, time.perf_counter())
+
+    def record(self, name, start, end):
+        with self.lock:
+            self.current[name] = self.current.get(name, 0.0) + end - start
+            self.spans.append((name, threading.get_ident(), start, end))
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        end = time.perf_counter()
+        index = self.head
+        with self.lock:
+            self.frame_times[index] = end - self.frame_start
+            for name, column in self.phases.items():
+                column[index] = self.current.pop(name, 0.0)
+            for name, duration in self.current.items():
+                column = np.zeros(self.capacity)
+                column[index] = duration
+                self.phases[name] = column
+            self.current.clear()
+            self.spans.append(('frame', threading.get_ident(), self.frame_start, end))
+        self.head = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.total += 1
+        self.frame_start = None
+
+    def latest(self, n, column=None):
+        column = self.frame_times if column is None else column
+        n = min(n, self.count)
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            return column[start:start + n].copy()
+        return np.concatenate((column[start:], column[:self.head]))
+
+    def window(self, name=None):
+        return self.latest(self.count, None if name is None else self.phases[name]) * 1000
+
+    def stats(self, name=None):
+        values = self.window(name)
+        if len(values) == 0:
+            return None
+        p50, p95, p99 = np.percentile(values, (50, 95, 99))
+        return {'mean': float(values.mean()), 'p50': float(p50), 'p95': float(p95),
+                'p99': float(p99), 'max': float(values.max())}
+
+    def histogram(self, name=None):
+        counts, _ = np.histogram(self.window(name), bins=HISTOGRAM_EDGES_MS)
+        return counts.tolist()
+
+    def summary(self):
+        phases = {}
+        if self.count:
+            for name in self.phases:
+                phases[name] = {**self.stats(name), 'histogram': self.histogram(name)}
+        return {
+            'frames': self.count,
+            'frame': self.stats(),
+            'frame_histogram': self.histogram(),
+            'histogram_edges_ms': list(HISTOGRAM_EDGES_MS[:-1]),
+            'phases': phases,
+        }
+
+    def export_json(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def export_chrome_trace(self, path):
+        with self.lock:
+            spans = list(self.spans)
+        origin = min(span[2] for span in spans) if spans else 0.0
+        events = [
+            {'name': name, 'ph': 'X', 'pid': 1, 'tid': thread,
+             'ts': (start - origin) * 1e6, 'dur': (end - start) * 1e6}
+            for name, thread, start, end in spans
+        ]
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+
+PROFILER = FrameProfiler()
@@ -0,0 +1,78 @@
+import time
+import logging
+import pygame
+from profiler import PROFILER
+from resources import RESOURCES
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+TOGGLE_KEY = pygame.K_F3
+EXPORT_KEY = pygame.K_F4
+PROFILER_KEYS = (TOGGLE_KEY, EXPORT_KEY)
+GRAPH_MAX_MS = 33.3
+BUDGET_MS = 1000 / 60
+REFRESH_FRAMES = 10
+
+
+class ProfilerOverlay:
+    def __init__(self, profiler=PROFILER, position=(10, 10), size=(340, 230)):
+        self.profiler = profiler
+        self.rect = pygame.Rect(position, size)
+        self.graph_rect = pygame.Rect(10, 10, size[0] - 20, 60)
+        self.surface = pygame.Surface(size)
+        self.font = RESOURCES.font('Courier New', 14)
+        self.visible = False
+        self.rendered_at = None
+
+    def handle_key(self, key):
+        if key == TOGGLE_KEY:
+            self.visible = not self.visible
+            if self.visible != self.profiler.enabled:
+                self.profiler.toggle()
+            self.rendered_at = None
+        elif key == EXPORT_KEY:
+            self.export()
+
+    def export(self, prefix=None):
+        if prefix is None:
+            prefix = time.strftime("profile-%Y%m%d-%H%M%S")
+        self.profiler.export_json(f"{prefix}.json")
+        self.profiler.export_chrome_trace(f"{prefix}.trace.json")
+        logger.info(f"Profile exported to {prefix}.json and {prefix}.trace.json")
+
+    def render(self):
+        surface = self.surface
+        surface.fill((15, 15, 25))
+        pygame.draw.rect(surface, (80, 80, 120), surface.get_rect(), 1)
+
+        graph = self.graph_rect
+        pygame.draw.rect(surface, (30, 30, 50), graph)
+        frames = self.profiler.latest(graph.width) * 1000
+        offset = graph.right - len(frames)
+        for i, value in enumerate(frames.tolist()):
+            height = int(min(1.0, value / GRAPH_MAX_MS) * graph.height)
+            color = (100, 200, 100) if value <= BUDGET_MS else (220, 80, 60)
+            pygame.draw.line(surface, color, (offset + i, graph.bottom - 1), (offset + i, graph.bottom - height))
+        budget_y = graph.bottom - int(BUDGET_MS / GRAPH_MAX_MS * graph.height)
+        pygame.draw.line(surface, (200, 200, 80), (graph.left, budget_y), (graph.right - 1, budget_y))
+
+        y = graph.bottom + 6
+        frame = self.profiler.stats()
+        if frame is not None:
+            text = f"frame  p50 {frame['p50']:.2f}  p95 {frame['p95']:.2f}  p99 {frame['p99']:.2f} ms"
+            surface.blit(self.font.render(text, True, (220, 220, 255)), (10, y))
+            y += 20
+            for name in sorted(self.profiler.phases):
+                if y > self.rect.height - 18:
+                    break
+                stats = self.profiler.stats(name)
+                text = f"{name:<16} {stats['mean']:6.2f} avg {stats['p95']:6.2f} p95"
+                surface.blit(self.font.render(text, True, (200, 200, 200)), (10, y))
+                y += 17
+        self.rendered_at = self.profiler.total
+
+    def draw(self, screen):
+        if self.rendered_at is None or self.profiler.total - self.rendered_at >= REFRESH_FRAMES:
+            self.render()
+        screen.blit(self.surface, self.rect)
+        return self.rect
@@ -0,0 +1,19 @@
+import random
+import zlib
+import numpy as np
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+
+    def key(self, name):
+        return [self.seed, zlib.crc32(name.encode())]
+
+    def generator(self, name):
+        return np.random.default_rng(self.key(name))
+
+    def random(self, name):
+        return random.Random(f"{self.seed}:{name}")
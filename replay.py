@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+import logging
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded operator session as fast as possible")
+    parser.add_argument('session', help="session file written with RECORD_SESSION")
+    parser.add_argument('--render', action='store_true', help="draw every tick instead of running headless")
+    args = parser.parse_args()
+
+    if not args.render:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from game import Game
+    from session import InputPlayback
+
+    logging.getLogger('ProductionLineSimulator').setLevel(logging.WARNING)
+    playback = InputPlayback(args.session)
+    game = Game('replay', playback=playback)
+
+    start = time.perf_counter()
+    counters = game.replay(render=args.render)
+    elapsed = time.perf_counter() - start
+
+    print(f"ticks: {game.tick} in {elapsed:.2f}s ({game.tick / max(elapsed, 1e-9):.0f} ticks/s)")
+    mismatched = False
+    for field, value in counters.items():
+        expected = playback.counters.get(field)
+        marker = "" if value == expected else f"  (recorded {expected})"
+        mismatched = mismatched or bool(marker)
+        print(f"{field}: {value}{marker}")
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import os
+import json
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+PULSE_FONT_SIZES = range(36, 45)
+EXPLOSION_FONT_STEP = 4
+EXPLOSION_FONT_SIZES = range(EXPLOSION_FONT_STEP, 73, EXPLOSION_FONT_STEP)
+SMOKE_SIZES = range(2, 7)
+SMOKE_ALPHA_STEP = 10
+FONT_CACHE_PATH = '.font_cache.json'
+
+
+class FontPathCache:
+    def __init__(self, path=FONT_CACHE_PATH):
+        self.path = path
+        self.entries = None
+
+    def load(self):
+        try:
+            with open(self.path) as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w') as file:
+                json.dump(self.entries, file, indent=1)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def resolve(self, name, bold=False, italic=False):
+        if self.entries is None:
+            self.load()
+        key = f"{name}|{int(bold)}|{int(italic)}"
+        entry = self.entries.get(key)
+        if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+            return entry
+
+        resolved = []
+        pygame.font.SysFont(name, 1, bold, italic,
+                            constructor=lambda path, size, set_bold, set_italic:
+                            resolved.extend((path, set_bold, set_italic)))
+        self.entries[key] = resolved
+        self.save()
+        return resolved
+
+
+FONT_PATHS = FontPathCache()
+
+
+class ResourcePool:
+    def __init__(self):
+        self.overlays = {}
+        self.outlines = {}
+        self.fonts = {}
+        self.smoke_sprites = {}
+
+    def overlay(self, color, alpha, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        key = (tuple(color), tuple(size))
+        surface = self.overlays.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            self.overlays[key] = surface
+        surface.set_alpha(alpha)
+        return surface
+
+    def outline(self, color, size, width, alpha):
+        key = (tuple(color), tuple(size), width)
+        surface = self.outlines.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, color, surface.get_rect(), width)
+            self.outlines[key] = surface
+        surface.set_alpha(alpha)
+        return surface
+
+    def font(self, name, size, bold=False):
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            path, set_bold, set_italic = FONT_PATHS.resolve(name, bold)
+            font = pygame.font.Font(path, size)
+            font.set_bold(set_bold)
+            font.set_italic(set_italic)
+            self.fonts[key] = font
+        return font
+
+    def explosion_font(self, name, size):
+        size = max(EXPLOSION_FONT_STEP, size - size % EXPLOSION_FONT_STEP)
+        return self.font(name, size, bold=True)
+
+    def preload_alarm_fonts(self, name='Arial'):
+        for size in PULSE_FONT_SIZES:
+            self.font(name, size, bold=True)
+        for size in EXPLOSION_FONT_SIZES:
+            self.font(name, size, bold=True)
+
+    def smoke_sprite(self, size, alpha):
+        alpha = alpha - alpha % SMOKE_ALPHA_STEP
+        key = (size, alpha)
+        sprite = self.smoke_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (100, 100, 100, alpha), (size, size), size)
+            self.smoke_sprites[key] = sprite
+        return sprite
+
+    def preload_smoke(self):
+        for size in SMOKE_SIZES:
+            for alpha in range(50, 151, SMOKE_ALPHA_STEP):
+                self.smoke_sprite(size, alpha)
+
+
+RESOURCES = ResourcePool()
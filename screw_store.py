@@ -0,0 +1,108 @@
+import numpy as np
+
+DEFECT_TYPES = (None, 'size', 'color', 'thread')
+SCREW_VARIANTS = 4
+MIN_SCREW_SIZE = 18
+MAX_SCREW_SIZE = 22
+
+SCREW_FIELDS = {
+    'id': np.int64,
+    'x': np.float64,
+    'y': np.float64,
+    'speed': np.float64,
+    'size': np.int16,
+    'defective': np.bool_,
+    'defect_type': np.int8,
+    'variant': np.int8,
+    'lane': np.int16,
+    'inspected': np.bool_,
+    'selected': np.bool_,
+    'marked_for_removal': np.bool_,
+    'removal_progress': np.float32,
+}
+
+
+class ScrewStore:
+    def __init__(self, view_class, capacity=64):
+        self.view_class = view_class
+        self.count = 0
+        self.next_id = 0
+        self.version = 0
+        self.capacity = 0
+        for name, dtype in SCREW_FIELDS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.reserve(capacity)
+
+    def reserve(self, capacity):
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, self.capacity * 2)
+        for name, dtype in SCREW_FIELDS.items():
+            grown = np.zeros(new_capacity, dtype=dtype)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+        self.capacity = new_capacity
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("screw index out of range")
+        return self.view_class(self, index)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.view_class(self, index)
+
+    def append(self, x, y, speed, size, defective, defect_type, variant, lane=0):
+        added = len(x)
+        start = self.count
+        end = start + added
+        self.reserve(end)
+
+        self.id[start:end] = np.arange(self.next_id, self.next_id + added)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.speed[start:end] = speed
+        self.size[start:end] = size
+        self.defective[start:end] = defective
+        self.defect_type[start:end] = defect_type
+        self.variant[start:end] = variant
+        self.lane[start:end] = lane
+        self.inspected[start:end] = False
+        self.selected[start:end] = False
+        self.marked_for_removal[start:end] = False
+        self.removal_progress[start:end] = 0
+
+        self.next_id += added
+        self.count = end
+        self.version += 1
+
+    def advance(self, frames):
+        self.version += 1
+        n = self.count
+        removing = self.marked_for_removal[:n]
+        moving = ~removing
+
+        self.removal_progress[:n][removing] += frames
+        self.y[:n][removing] += 5 * frames
+        self.x[:n][moving] -= self.speed[:n][moving] * frames
+
+        return np.where(removing, self.removal_progress[:n] > 20, self.x[:n] < -50)
+
+    def compact(self, keep):
+        kept = int(np.count_nonzero(keep))
+        if kept == self.count:
+            return
+        for name in SCREW_FIELDS:
+            column = getattr(self, name)
+            column[:kept] = column[:self.count][keep]
+        self.count = kept
+        self.version += 1
+
+    def clear(self):
+        self.count = 0
+        self.version += 1
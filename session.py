@@ -0,0 +1,68 @@
+import json
+from telemetry import ReplaySource, write_trace
+
+SESSION_VERSION = 1
+
+INPUT_QUIT = 0
+INPUT_KEY = 1
+INPUT_CLICK = 2
+
+COUNTER_FIELDS = ('good_count', 'defective_count', 'missed_defects', 'false_positives',
+                  'score', 'level', 'fire_count', 'exploded')
+
+
+def trace_path(path):
+    return f"{path}.trace"
+
+
+def line_counters(line):
+    return {field: getattr(line, field) for field in COUNTER_FIELDS}
+
+
+class InputRecorder:
+    def __init__(self, path, seed, source):
+        self.path = path
+        self.seed = seed
+        self.source = source
+        self.events = []
+
+    def record(self, tick, kind, a=0, b=0):
+        self.events.append((tick, kind, a, b))
+
+    def save(self, ticks, counters):
+        session = {
+            'version': SESSION_VERSION,
+            'seed': self.seed,
+            'ticks': ticks,
+            'counters': counters,
+            'events': [value for event in self.events for value in event],
+        }
+        with open(self.path, 'w') as file:
+            json.dump(session, file, separators=(',', ':'))
+        write_trace(trace_path(self.path), self.source.snapshots)
+
+
+class InputPlayback:
+    def __init__(self, path):
+        with open(path) as file:
+            session = json.load(file)
+        if session.get('version') != SESSION_VERSION:
+            raise ValueError(f"Unsupported session version: {session.get('version')}")
+        self.path = path
+        self.seed = session['seed']
+        self.ticks = session['ticks']
+        self.counters = session['counters']
+        flat = session['events']
+        self.events = [tuple(flat[i:i + 4]) for i in range(0, len(flat), 4)]
+        self.position = 0
+
+    def source(self):
+        return ReplaySource(trace_path(self.path), loop=False)
+
+    def due(self, tick):
+        while self.position < len(self.events) and self.events[self.position][0] <= tick:
+            yield self.events[self.position][1:]
+            self.position += 1
+
+    def finished(self):
+        return self.position >= len(self.events)
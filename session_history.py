@@ -0,0 +1,129 @@
+import time
+import sqlite3
+import logging
+import platform
+import threading
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+SESSION_DB = 'sessions.db'
+
+SESSION_COLUMNS = ('operator', 'station', 'started_at', 'ended_at', 'day', 'duration', 'score', 'level',
+                   'good_count', 'defective_count', 'missed_defects', 'false_positives', 'fire_count',
+                   'exploded')
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sessions ("
+    "id INTEGER PRIMARY KEY, operator TEXT NOT NULL, station TEXT, started_at REAL, ended_at REAL, "
+    "day TEXT, duration REAL, score INTEGER, level INTEGER, good_count INTEGER, defective_count INTEGER, "
+    "missed_defects INTEGER, false_positives INTEGER, fire_count INTEGER, exploded INTEGER)",
+    "CREATE INDEX IF NOT EXISTS sessions_operator_started ON sessions (operator, started_at)",
+    "CREATE INDEX IF NOT EXISTS sessions_operator_score ON sessions (operator, score)",
+    "CREATE INDEX IF NOT EXISTS sessions_day_score ON sessions (day, score)",
+    "CREATE INDEX IF NOT EXISTS sessions_score ON sessions (score)",
+    "CREATE INDEX IF NOT EXISTS sessions_day_operator_score ON sessions (day, operator, score, level)",
+    "CREATE TABLE IF NOT EXISTS operator_stats ("
+    "operator TEXT PRIMARY KEY, sessions INTEGER, best_score INTEGER, best_level INTEGER)",
+    "CREATE INDEX IF NOT EXISTS operator_stats_best ON operator_stats (best_score)",
+)
+
+BACKFILL_STATS = ("INSERT INTO operator_stats (operator, sessions, best_score, best_level) "
+                  "SELECT operator, COUNT(*), MAX(score), level FROM sessions GROUP BY operator")
+
+UPDATE_STATS = ("INSERT INTO operator_stats (operator, sessions, best_score, best_level) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT (operator) DO UPDATE SET sessions = sessions + 1, "
+                "best_level = CASE WHEN excluded.best_score > best_score THEN excluded.best_level "
+                "ELSE best_level END, "
+                "best_score = MAX(best_score, excluded.best_score)")
+
+
+def station_name():
+    return platform.node() or 'station'
+
+
+class SessionStore:
+    def __init__(self, path=SESSION_DB):
+        self.path = path
+        self.local = threading.local()
+        self.version = 0
+        with self.connection() as connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+            stale = connection.execute("SELECT NOT EXISTS (SELECT 1 FROM operator_stats) "
+                                       "AND EXISTS (SELECT 1 FROM sessions)").fetchone()[0]
+            if stale:
+                connection.execute(BACKFILL_STATS)
+
+    def connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self.local.connection = connection
+        return connection
+
+    def record(self, session):
+        session = dict(session)
+        session.setdefault('station', station_name())
+        session.setdefault('day', time.strftime('%Y-%m-%d', time.localtime(session['started_at'])))
+        session['exploded'] = int(bool(session.get('exploded', False)))
+        values = [session.get(column) for column in SESSION_COLUMNS]
+        with self.connection() as connection:
+            connection.execute(
+                f"INSERT INTO sessions ({', '.join(SESSION_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(SESSION_COLUMNS))})",
+                values,
+            )
+            connection.execute(UPDATE_STATS, (session['operator'], session.get('score'), session.get('level')))
+        self.version += 1
+
+    def leaderboard(self, limit=10, day=None):
+        if day is None:
+            query = ("SELECT operator, best_score, best_level, sessions FROM operator_stats "
+                     "ORDER BY best_score DESC LIMIT ?")
+            return self.connection().execute(query, (limit,)).fetchall()
+        query = ("SELECT operator, MAX(score), level, COUNT(*) FROM sessions WHERE day = ? "
+                 "GROUP BY operator ORDER BY 2 DESC LIMIT ?")
+        return self.connection().execute(query, (day, limit)).fetchall()
+
+    def top_sessions(self, limit=10):
+        query = "SELECT operator, score, level, day FROM sessions ORDER BY score DESC LIMIT ?"
+        return self.connection().execute(query, (limit,)).fetchall()
+
+    def operator_trend(self, operator, since=0.0):
+        query = ("SELECT day, COUNT(*), AVG(score), MAX(score), SUM(missed_defects) FROM sessions "
+                 "WHERE operator = ? AND started_at >= ? GROUP BY day ORDER BY day")
+        return self.connection().execute(query, (operator, since)).fetchall()
+
+    def shift_summary(self, day):
+        query = ("SELECT COUNT(*), COUNT(DISTINCT operator), SUM(duration), SUM(good_count), "
+                 "SUM(defective_count), SUM(missed_defects), SUM(false_positives), SUM(fire_count), "
+                 "AVG(score) FROM sessions WHERE day = ?")
+        row = self.connection().execute(query, (day,)).fetchone()
+        return dict(zip(('sessions', 'operators', 'duration', 'good_count', 'defective_count',
+                         'missed_defects', 'false_positives', 'fire_count', 'mean_score'), row))
+
+
+class Leaderboard:
+    def __init__(self, store, limit=5):
+        self.store = store
+        self.limit = limit
+        self.rows = None
+        self.version = None
+        self.loading = False
+
+    def get(self):
+        if self.version != self.store.version and not self.loading:
+            self.loading = True
+            threading.Thread(target=self.refresh, args=(self.store.version,), name='Leaderboard',
+                             daemon=True).start()
+        return self.rows
+
+    def refresh(self, version):
+        try:
+            self.rows = tuple(self.store.leaderboard(self.limit))
+        except sqlite3.Error as error:
+            logger.error(f"Leaderboard query failed: {error}")
+        finally:
+            self.version = version
+            self.loading = False
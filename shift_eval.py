@@ -0,0 +1,265 @@
+import os
+import json
+import random
+import hashlib
+import logging
+import argparse
+import itertools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from constants import SCREEN_WIDTH, FPS
+from simulation import LineSimulation
+from telemetry import SystemMonitor, create_source
+from random_streams import RandomStreams
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+CACHE_DIR = '.shift_cache'
+CACHE_VERSION = 2
+
+DEFAULT_PARAMS = {
+    'spawn_interval': 1.5,
+    'conveyor_speed': 2,
+    'overheat_temp': 60,
+    'defect_temp_threshold': 50,
+    'shift_seconds': 480.0,
+    'dt': 1 / FPS,
+    'telemetry': 'synthetic',
+}
+
+DEFAULT_POLICY = {
+    'reaction_time': 1.0,
+    'miss_rate': 0.1,
+    'false_alarm_rate': 0.05,
+}
+
+STAT_FIELDS = ('good_count', 'defective_count', 'missed_defects', 'false_positives')
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class OperatorPolicy:
+    def __init__(self, reaction_time, miss_rate, false_alarm_rate, rng=None):
+        self.reaction_time = reaction_time
+        self.miss_rate = miss_rate
+        self.false_alarm_rate = false_alarm_rate
+        self.rng = rng if rng is not None else random.Random()
+        self.last_id = -1
+        self.last_attempt = None
+
+    def act(self, line):
+        self.inspect(line)
+        self.fight_fire(line)
+
+    def inspect(self, line):
+        screws = line.screws
+        n = screws.count
+        speed = line.conveyor_speed * line.production_rate
+        reach_x = SCREEN_WIDTH + 20 - speed * FPS * self.reaction_time
+        seen = (screws.id[:n] > self.last_id) & (screws.x[:n] <= reach_x) & ~screws.marked_for_removal[:n]
+        for index in np.flatnonzero(seen).tolist():
+            if screws.defective[index]:
+                remove = self.rng.random() >= self.miss_rate
+            else:
+                remove = self.rng.random() < self.false_alarm_rate
+            if remove:
+                line.remove_screw(index)
+        if seen.any():
+            self.last_id = int(screws.id[:n][seen].max())
+
+    def fight_fire(self, line):
+        if not line.critical_failure or line.exploded:
+            self.last_attempt = None
+            return
+        start = line.fire_start_time if self.last_attempt is None else self.last_attempt
+        if line.time - start >= self.reaction_time:
+            self.last_attempt = line.time
+            line.extinguish_fire()
+
+
+def simulate_shift(params, policy, seed):
+    kind = params['telemetry'].partition(':')[0]
+    source = create_source(f"{kind}:{seed}" if kind == 'synthetic' else params['telemetry'])
+    monitor = SystemMonitor(source=source)
+
+    line = LineSimulation(monitor, streams=RandomStreams(seed))
+    line.spawn_interval = params['spawn_interval']
+    line.conveyor_speed = params['conveyor_speed']
+    line.overheat_temp = params['overheat_temp']
+    line.defect_temp_threshold = params['defect_temp_threshold']
+    operator = OperatorPolicy(rng=line.streams.random('operator'), **policy)
+
+    dt = params['dt']
+    for _ in range(int(params['shift_seconds'] / dt)):
+        line.step(dt)
+        operator.act(line)
+        if line.exploded:
+            break
+    source.close()
+
+    result = {
+        'seed': seed,
+        'score': line.score,
+        'level': line.level,
+        'critical_failure_time': line.critical_failure_time,
+        'fires': line.fire_count,
+        'exploded': line.exploded,
+        'elapsed': line.time,
+    }
+    for field in STAT_FIELDS:
+        result[field] = getattr(line, field)
+    return result
+
+
+def run_key(params, policy, seed):
+    payload = json.dumps({'version': CACHE_VERSION, 'params': params, 'policy': policy, 'seed': seed},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ShiftCache:
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self.path(key)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, result):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as file:
+            json.dump(result, file)
+        os.replace(temp_path, path)
+
+
+def init_worker():
+    logging.getLogger('ProductionLineSimulator').setLevel(logging.WARNING)
+
+
+def run_job(job):
+    params, policy, seed = job
+    return simulate_shift(params, policy, seed)
+
+
+class ShiftEvaluator:
+    def __init__(self, cache=None, workers=None):
+        self.cache = cache if cache is not None else ShiftCache()
+        self.workers = workers or os.cpu_count() or 1
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, params, policy, seeds):
+        params = {**DEFAULT_PARAMS, **params}
+        policy = {**DEFAULT_POLICY, **policy}
+        keys = [run_key(params, policy, seed) for seed in seeds]
+        results = {key: self.cache.get(key) for key in keys}
+
+        pending = [(key, seed) for key, seed in zip(keys, seeds) if results[key] is None]
+        self.hits += len(keys) - len(pending)
+        self.misses += len(pending)
+        jobs = [(params, policy, seed) for _, seed in pending]
+
+        workers = max(1, min(self.workers, len(jobs)))
+        if workers == 1:
+            init_worker()
+            computed = map(run_job, jobs)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+            computed = pool.map(run_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+        try:
+            for (key, _), result in zip(pending, computed):
+                self.cache.put(key, result)
+                results[key] = result
+        finally:
+            if workers > 1:
+                pool.shutdown()
+
+        return [results[key] for key in keys]
+
+    def sweep(self, grid, policy, seeds):
+        names = sorted(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            params = dict(zip(names, values))
+            yield params, summarize(self.evaluate(params, policy, seeds))
+
+
+def distribution(values):
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return {}
+    stats = {'mean': float(values.mean()), 'std': float(values.std())}
+    for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        stats[f"p{percentile}"] = float(value)
+    return stats
+
+
+def summarize(results):
+    failure_times = [result['critical_failure_time'] for result in results
+                     if result['critical_failure_time'] is not None]
+    hours = sum(result['elapsed'] for result in results) / 3600
+    return {
+        'shifts': len(results),
+        'score': distribution([result['score'] for result in results]),
+        'level': distribution([result['level'] for result in results]),
+        'time_to_critical': distribution(failure_times),
+        'critical_fraction': len(failure_times) / len(results) if results else 0.0,
+        'fires_per_shift': distribution([result['fires'] for result in results]),
+        'fires_per_hour': sum(result['fires'] for result in results) / hours if hours else 0.0,
+        'explosions': sum(1 for result in results if result['exploded']),
+    }
+
+
+def parse_values(text, cast=float):
+    return [cast(value) for value in text.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo evaluation of operator shifts")
+    parser.add_argument('--shifts', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shift-seconds', type=float, default=DEFAULT_PARAMS['shift_seconds'])
+    parser.add_argument('--spawn-interval', default=str(DEFAULT_PARAMS['spawn_interval']),
+                        help="comma separated values to sweep")
+    parser.add_argument('--conveyor-speed', default=str(DEFAULT_PARAMS['conveyor_speed']))
+    parser.add_argument('--overheat-temp', default=str(DEFAULT_PARAMS['overheat_temp']))
+    parser.add_argument('--defect-temp-threshold', default=str(DEFAULT_PARAMS['defect_temp_threshold']))
+    parser.add_argument('--telemetry', default=DEFAULT_PARAMS['telemetry'])
+    parser.add_argument('--reaction-time', type=float, default=DEFAULT_POLICY['reaction_time'])
+    parser.add_argument('--miss-rate', type=float, default=DEFAULT_POLICY['miss_rate'])
+    parser.add_argument('--false-alarm-rate', type=float, default=DEFAULT_POLICY['false_alarm_rate'])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    init_worker()
+    grid = {
+        'spawn_interval': parse_values(args.spawn_interval),
+        'conveyor_speed': parse_values(args.conveyor_speed),
+        'overheat_temp': parse_values(args.overheat_temp),
+        'defect_temp_threshold': parse_values(args.defect_temp_threshold),
+        'shift_seconds': [args.shift_seconds],
+        'telemetry': [args.telemetry],
+    }
+    policy = {
+        'reaction_time': args.reaction_time,
+        'miss_rate': args.miss_rate,
+        'false_alarm_rate': args.false_alarm_rate,
+    }
+    seeds = range(args.seed, args.seed + args.shifts)
+
+    evaluator = ShiftEvaluator(ShiftCache(args.cache_dir), args.workers)
+    for params, summary in evaluator.sweep(grid, policy, seeds):
+        print(json.dumps({'params': params, 'policy': policy, **summary}))
+    print(f"cached: {evaluator.hits}, computed: {evaluator.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+import math
+import logging
+import numpy as np
+from constants import SCREEN_WIDTH, FPS
+from screw_store import ScrewStore, DEFECT_TYPES, SCREW_VARIANTS, MIN_SCREW_SIZE, MAX_SCREW_SIZE
+from spatial_index import ScrewIndex
+from particles import ParticlePool, FIRE_COLORS, EXPLOSION_COLORS
+from random_streams import RandomStreams
+from profiler import PROFILER
+from notifications import NotificationRing
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+TICK_SECONDS = 1.0 / FPS
+MAX_CATCH_UP_TICKS = 8
+WARNING_DURATION = 5.0
+INSPECTION_X = SCREEN_WIDTH // 2
+BELT_Y = 365
+LANE_SPACING = 100
+
+
+def _column(name):
+    def get(self):
+        return getattr(self.store, name)[self.index].item()
+
+    def set(self, value):
+        getattr(self.store, name)[self.index] = value
+        self.store.version += 1
+
+    return property(get, set)
+
+
+class Screw:
+    color = (180, 180, 180)
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    id = _column('id')
+    x = _column('x')
+    y = _column('y')
+    speed = _column('speed')
+    size = _column('size')
+    defective = _column('defective')
+    variant = _column('variant')
+    lane = _column('lane')
+    inspected = _column('inspected')
+    selected = _column('selected')
+    marked_for_removal = _column('marked_for_removal')
+    removal_progress = _column('removal_progress')
+
+    @property
+    def defect_type(self):
+        return DEFECT_TYPES[self.store.defect_type[self.index]]
+
+
+class LineSimulation:
+    screw_class = Screw
+
+    def __init__(self, system_monitor, speed_multiplier=1.0, background_mode=False,
+                 lane=0, belt_y=BELT_Y, screws=None, streams=None):
+        self.lane = lane
+        self.streams = streams if streams is not None else RandomStreams()
+        self.belt_y = belt_y
+        self.screws = screws if screws is not None else ScrewStore(self.screw_class)
+        self.screw_index = ScrewIndex(self.screws, lane if screws is not None else None)
+        self.system_monitor = system_monitor
+        self.rng = self.streams.generator(f"screws:{lane}")
+        self.random = self.streams.random(f"line:{lane}")
+        self.tick = 0
+        self.time = 0.0
+        self.spawn_progress = 1.0
+        self.belt_position = 0.0
+        self.spawn_interval = 1.5
+        self.conveyor_speed = 2
+        self.overheat_temp = 60
+        self.defect_temp_threshold = 50
+        self.production_rate = 1.0 * speed_multiplier
+        self.selected_screw_index = -1
+        self.audit = None
+        self.good_count = 0
+        self.defective_count = 0
+        self.missed_defects = 0
+        self.false_positives = 0
+        self.score = 0
+        self.level = 1
+        self.temperature_warning = False
+        self.machine_status = "Normal Operation"
+        self.machine_health = 100
+        self.warning_messages = NotificationRing(duration=WARNING_DURATION)
+        self.alert_active = False
+        self.background_mode = background_mode
+        self.fire_particles = ParticlePool()
+        self.fire_intensity = 1.0
+        self.critical_failure = False
+        self.critical_failure_time = None
+        self.fire_count = 0
+        self.exploded = False
+
+    def step(self, dt=TICK_SECONDS):
+        self.begin_step(dt)
+
+        screws = self.screws
+        screws.speed[:screws.count] = self.conveyor_speed * self.production_rate
+        expired = screws.advance(dt * FPS)
+        if expired.any():
+            escaped = expired & ~screws.marked_for_removal[:screws.count] & ~screws.inspected[:screws.count]
+            defective = screws.defective[:screws.count]
+            if self.audit is not None:
+                self.audit_escaped(escaped & defective)
+            self.account_escaped(int(np.count_nonzero(escaped & defective)),
+                                 int(np.count_nonzero(escaped & ~defective)))
+            screws.compact(~expired)
+
+        self.end_step(dt)
+
+    def begin_step(self, dt):
+        self.tick += 1
+        self.time += dt
+
+        poll = getattr(self.system_monitor, 'poll', None)
+        if poll is not None:
+            poll(self.time)
+
+        self.belt_position += self.conveyor_speed * self.production_rate * dt * FPS
+        self.spawn_screws(dt)
+
+    def account_escaped(self, missed, good):
+        if self.background_mode:
+            return
+        self.good_count += good
+        for _ in range(missed):
+            self.missed_defects += 1
+            self.add_warning("Missed defective product!")
+            self.machine_health = max(0, self.machine_health - 1.0)
+
+    def audit_decision(self, screw, decision, outcome):
+        if self.audit is not None:
+            self.audit.record(self.tick, self.time, self.lane, screw.id, screw.defect_type, decision, outcome)
+
+    def audit_escaped(self, mask):
+        for index in np.flatnonzero(mask).tolist():
+            self.audit_decision(self.screws[index], 'expired', 'missed_defect')
+
+    def end_step(self, dt):
+        snapshot = self.system_monitor.snapshot
+        if snapshot.cpu_temp > self.overheat_temp and not self.background_mode:
+            self.temperature_warning = True
+            if self.random.random() < 0.1:
+                self.machine_health -= 0.2
+                self.production_rate = max(0.7, self.production_rate - 0.01)
+                self.add_warning("High temperature affecting production!")
+        else:
+            self.temperature_warning = False
+
+        if self.missed_defects > 0 and self.random.random() < 0.05:
+            self.machine_health -= 0.5
+
+        if snapshot.cpu_temp > self.overheat_temp:
+            self.temperature_warning = True
+            if self.random.random() < 0.1:
+                self.machine_health -= 0.2
+                self.production_rate = max(0.7, self.production_rate - 0.01)
+                self.add_warning("High temperature affecting production!")
+        else:
+            self.temperature_warning = False
+
+        if self.machine_health < 30:
+            self.machine_status = "Critical Condition"
+            self.alert_active = True
+            if self.machine_health < 15 and not self.critical_failure:
+                self.critical_failure = True
+                self.start_fire_simulation()
+        elif self.machine_health < 60:
+            self.machine_status = "Maintenance Required"
+        elif self.machine_health < 80:
+            self.machine_status = "Minor Issues"
+        else:
+            self.machine_status = "Normal Operation"
+
+        if self.critical_failure:
+            started = PROFILER.start()
+            self.update_fire_particles(dt)
+            PROFILER.stop('update/particles', started)
+
+        self.defect_probability_modifier = min(1.0, 0.15 + (self.missed_defects * 0.01))
+
+        if not self.background_mode:
+            self.update_score()
+
+        self.warning_messages.update(self.time)
+
+    def spawn_screws(self, dt):
+        spawn_period = self.spawn_interval / self.production_rate
+        self.spawn_progress += dt / spawn_period
+        count = int(self.spawn_progress)
+        if count == 0:
+            return
+        self.spawn_progress -= count
+        overdue = (self.spawn_progress + np.arange(count - 1, -1, -1)) * spawn_period
+
+        speed = self.conveyor_speed * self.production_rate
+        defective = self.determine_if_defective(count)
+        defect_type = np.where(defective, self.rng.integers(1, len(DEFECT_TYPES), count), 0)
+        self.screws.append(
+            x=SCREEN_WIDTH + 20 - speed * FPS * overdue,
+            y=np.full(count, self.belt_y - 15.0),
+            speed=np.full(count, speed),
+            size=self.rng.integers(MIN_SCREW_SIZE, MAX_SCREW_SIZE + 1, count),
+            defective=defective,
+            defect_type=defect_type,
+            variant=self.rng.integers(0, SCREW_VARIANTS, count),
+            lane=self.lane,
+        )
+
+    def determine_if_defective(self, count):
+        base_probability = 0.15
+
+        modifier = getattr(self.system_monitor, 'defect_probability_modifier', 0)
+
+        snapshot = self.system_monitor.snapshot
+        temp_factor = 0.005 * max(0, snapshot.cpu_temp - self.defect_temp_threshold)
+        usage_factor = 0.002 * snapshot.cpu_usage
+
+        total_probability = base_probability + temp_factor + usage_factor + modifier
+        return self.rng.random(count) < min(0.70, total_probability)
+
+    def update_score(self):
+        self.score = (self.good_count * 10 +
+                     self.defective_count * 20 -
+                     self.missed_defects * 15 -
+                     self.false_positives * 10)
+
+        total_inspected = self.good_count + self.defective_count
+        level = 1 + total_inspected // 20
+
+        if level > 1:
+            target_rate = min(1.0 + (level - 1) * 0.1, 2.0)
+            self.production_rate = min(target_rate, self.production_rate + 0.01)
+        if level != self.level:
+            self.level = level
+            logger.info(f"Level up to {self.level}! Production speed: {self.production_rate:.1f}x")
+
+    def start_fire_simulation(self):
+        self.fire_particles.clear()
+        self.fire_start_time = self.time
+        self.fire_count += 1
+        if self.critical_failure_time is None:
+            self.critical_failure_time = self.time
+        self.fire_intensity = 1.0
+        self.emit_fire_particles(20, spread_x=150, max_size=8, vx_range=(0.5, 2.0), vy_range=(-5, -2))
+
+    def update_fire_particles(self, dt=TICK_SECONDS):
+        if not self.exploded:
+            elapsed_time = self.time - self.fire_start_time
+            fire_stages = int(elapsed_time / 3)
+
+            if fire_stages > 0 and self.fire_intensity < 5.0:
+                self.fire_intensity = min(1.0 + (fire_stages * 0.8), 5.0)
+
+            if self.fire_intensity >= 5.0:
+                self.trigger_explosion()
+                return
+
+            if self.random.random() < 0.2 * self.fire_intensity:
+                self.emit_fire_particles(int(5 * self.fire_intensity),
+                                         spread_x=150 + int(100 * self.fire_intensity),
+                                         max_size=int(8 * self.fire_intensity),
+                                         vx_range=(0, 1.5), vy_range=(-5, -1))
+
+        self.fire_particles.update(dt * FPS)
+
+    def emit_fire_particles(self, count, spread_x, max_size, vx_range, vy_range):
+        rng = self.rng
+        self.fire_particles.emit(
+            x=rng.integers(0, spread_x + 1, count),
+            y=np.full(count, self.belt_y),
+            vx=rng.uniform(*vx_range, count),
+            vy=rng.uniform(*vy_range, count),
+            size=rng.integers(3, max_size + 1, count),
+            color=rng.choice(FIRE_COLORS, count),
+            life=rng.integers(30, 91, count),
+        )
+
+    def add_warning(self, message):
+        self.warning_messages.push(message, self.time)
+
+    def trigger_explosion(self):
+        rng = self.rng
+        count = 500
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(5, 15, count)
+        self.fire_particles.clear()
+        self.fire_particles.emit(
+            x=np.full(count, SCREEN_WIDTH // 2),
+            y=np.full(count, self.belt_y - 15),
+            vx=np.cos(angle) * speed,
+            vy=np.sin(angle) * speed,
+            size=rng.integers(5, 16, count),
+            color=rng.choice(EXPLOSION_COLORS, count),
+            life=rng.integers(30, 91, count),
+        )
+
+        self.machine_health = 0
+        self.explosion_time = self.time
+        self.exploded = True
+
+    def extinguish_fire(self):
+        if self.fire_intensity < 4.0:
+            self.critical_failure = False
+            self.fire_particles.clear()
+            self.machine_health += 20
+            self.add_warning("Fire extinguished successfully!")
+            return True
+        self.add_warning("Fire too intense! Cannot extinguish!")
+        return False
+
+    def select_screw(self, mouse_pos):
+        index = self.screw_index.hit_test(mouse_pos)
+        if index < 0:
+            return None
+        return self.remove_screw(index)
+
+    def remove_screw(self, index):
+        screw = self.screws[index]
+        if screw.marked_for_removal:
+            return None
+        if screw.inspected:
+            screw.marked_for_removal = True
+            return None
+        if screw.defective:
+            screw.marked_for_removal = True
+            self.audit_decision(screw, 'remove', 'correct')
+            self.defective_count += 1
+            self.machine_health = min(100, self.machine_health + 0.5)
+            return True
+        else:
+            screw.marked_for_removal = True
+            self.audit_decision(screw, 'remove', 'false_positive')
+            self.false_positives += 1
+            self.add_warning("False alarm! Product was good!")
+            self.machine_health = max(0, self.machine_health - 0.5)
+            return False
+
+    def target_screw(self):
+        if 0 <= self.selected_screw_index < len(self.screws):
+            return self.screws[self.selected_screw_index]
+        index = self.screw_index.nearest(INSPECTION_X)
+        if index < 0:
+            return None
+        return self.screws[index]
+
+    def mark_defective(self):
+        screw = self.target_screw()
+        if screw is not None:
+            if not screw.inspected:
+                screw.inspected = True
+                if screw.defective:
+                    self.audit_decision(screw, 'defective', 'correct')
+                    self.defective_count += 1
+                    self.machine_health = min(100, self.machine_health + 0.2)
+                else:
+                    self.audit_decision(screw, 'defective', 'false_positive')
+                    self.false_positives += 1
+                    self.add_warning("False alarm! Product was good!")
+
+    def mark_good(self):
+        screw = self.target_screw()
+        if screw is not None:
+            if not screw.inspected:
+                screw.inspected = True
+                if not screw.defective:
+                    self.audit_decision(screw, 'good', 'correct')
+                    self.good_count += 1
+                else:
+                    self.audit_decision(screw, 'good', 'missed_defect')
+                    self.missed_defects += 1
+                    self.add_warning("Defective product marked as good!")
+                    self.machine_health = max(0, self.machine_health - 1.0)
+
+
+class LineGroup:
+    line_class = LineSimulation
+
+    def __init__(self, system_monitor, speed_multipliers, belt_ys=None, background_mode=False, streams=None):
+        if belt_ys is None:
+            belt_ys = [BELT_Y + lane * LANE_SPACING for lane in range(len(speed_multipliers))]
+        self.system_monitor = system_monitor
+        self.streams = streams if streams is not None else RandomStreams()
+        self.screws = ScrewStore(self.line_class.screw_class)
+        self.production_lines = [
+            self.line_class(system_monitor, speed_multiplier=multiplier, background_mode=background_mode,
+                            lane=lane, belt_y=belt_y, screws=self.screws, streams=self.streams)
+            for lane, (multiplier, belt_y) in enumerate(zip(speed_multipliers, belt_ys))
+        ]
+        self.lane_speeds = np.zeros(len(self.production_lines))
+
+    def step(self, dt=TICK_SECONDS):
+        lines = self.production_lines
+        for line in lines:
+            line.begin_step(dt)
+
+        screws = self.screws
+        n = screws.count
+        for i, line in enumerate(lines):
+            self.lane_speeds[i] = line.conveyor_speed * line.production_rate
+        lanes = screws.lane[:n]
+        screws.speed[:n] = self.lane_speeds[lanes]
+
+        expired = screws.advance(dt * FPS)
+        if expired.any():
+            escaped = expired & ~screws.marked_for_removal[:n] & ~screws.inspected[:n]
+            defective = screws.defective[:n]
+            for line in lines:
+                if line.audit is not None:
+                    line.audit_escaped(escaped & defective & (lanes == line.lane))
+            missed = np.bincount(lanes[escaped & defective], minlength=len(lines))
+            good = np.bincount(lanes[escaped & ~defective], minlength=len(lines))
+            for line, line_missed, line_good in zip(lines, missed.tolist(), good.tolist()):
+                line.account_escaped(line_missed, line_good)
+            screws.compact(~expired)
+
+        for line in lines:
+            line.end_step(dt)
@@ -0,0 +1,37 @@
+import pygame
+
+
+class Sparkline:
+    def __init__(self, field, size, value_range=(0, 100), color=(200, 200, 255), background=(30, 30, 50)):
+        self.field = field
+        self.width, self.height = size
+        self.value_range = value_range
+        self.color = color
+        self.background = background
+        self.surface = pygame.Surface(size)
+        self.surface.fill(background)
+        self.seen = 0
+
+    def value_y(self, value):
+        low, high = self.value_range
+        ratio = min(1.0, max(0.0, (value - low) / (high - low)))
+        return self.height - 1 - int(ratio * (self.height - 1))
+
+    def update(self, history):
+        new_samples = history.total - self.seen
+        if new_samples <= 0:
+            return
+        self.seen = history.total
+        new_samples = min(new_samples, self.width)
+        values = history.latest(new_samples, self.field)
+
+        self.surface.scroll(-len(values), 0)
+        self.surface.fill(self.background, (self.width - len(values), 0, len(values), self.height))
+        for i, value in enumerate(values):
+            x = self.width - len(values) + i
+            pygame.draw.line(self.surface, self.color, (x, self.height - 1), (x, self.value_y(value)))
+
+    def draw(self, screen, history, position):
+        self.update(history)
+        screen.blit(self.surface, position)
+        return self.surface.get_rect(topleft=position)
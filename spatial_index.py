@@ -0,0 +1,70 @@
+import math
+import numpy as np
+from screw_store import MAX_SCREW_SIZE
+
+
+class ScrewIndex:
+    def __init__(self, store, lane=None):
+        self.store = store
+        self.lane = lane
+        self.version = -1
+        self.order = np.zeros(0, dtype=np.intp)
+        self.xs = np.zeros(0)
+
+    def refresh(self):
+        store = self.store
+        if self.version == store.version:
+            return
+        n = store.count
+        candidates = ~store.marked_for_removal[:n]
+        if self.lane is not None:
+            candidates &= store.lane[:n] == self.lane
+        order = np.flatnonzero(candidates)
+        xs = store.x[order]
+        if len(xs) > 1 and np.any(xs[1:] < xs[:-1]):
+            by_x = np.argsort(xs, kind='stable')
+            order = order[by_x]
+            xs = xs[by_x]
+        self.order = order
+        self.xs = xs
+        self.version = store.version
+
+    def hit_test(self, point):
+        self.refresh()
+        px, py = point
+        start = np.searchsorted(self.xs, px - MAX_SCREW_SIZE, side='left')
+        end = np.searchsorted(self.xs, px + MAX_SCREW_SIZE, side='right')
+
+        store = self.store
+        for index in sorted(self.order[start:end].tolist()):
+            dx = px - store.x[index]
+            dy = py - store.y[index]
+            size = int(store.size[index])
+            in_body = abs(dx) < size // 3 and 0 < dy < size * 3
+            if math.sqrt(dx*dx + dy*dy) < size or in_body:
+                return index
+        return -1
+
+    def nearest(self, px, max_distance=math.inf, include_inspected=False):
+        self.refresh()
+        if len(self.xs) == 0:
+            return -1
+
+        inspected = self.store.inspected
+        right = int(np.searchsorted(self.xs, px, side='left'))
+        left = right - 1
+        while left >= 0 or right < len(self.xs):
+            left_distance = px - self.xs[left] if left >= 0 else math.inf
+            right_distance = self.xs[right] - px if right < len(self.xs) else math.inf
+            if left_distance <= right_distance:
+                candidate, distance = left, left_distance
+                left -= 1
+            else:
+                candidate, distance = right, right_distance
+                right += 1
+            if distance > max_distance:
+                return -1
+            index = int(self.order[candidate])
+            if include_inspected or not inspected[index]:
+                return index
+        return -1
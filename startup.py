@@ -0,0 +1,41 @@
+import os
+import json
+import time
+import logging
+
+logger = logging.getLogger('ProductionLineSimulator')
+
+STARTUP_REPORT_ENV = 'STARTUP_REPORT'
+
+
+class StartupTimer:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+        self.reported = False
+
+    def mark(self, name):
+        if not self.reported:
+            self.marks.append((name, time.perf_counter() - self.start))
+
+    def report(self, path=None):
+        if self.reported:
+            return
+        self.mark('first_frame')
+        self.reported = True
+
+        previous = 0.0
+        phases = []
+        for name, elapsed in self.marks:
+            phases.append(f"{name} +{(elapsed - previous) * 1000:.0f}ms")
+            previous = elapsed
+        logger.info(f"Time to first frame: {previous * 1000:.0f}ms ({', '.join(phases)})")
+
+        path = path or os.environ.get(STARTUP_REPORT_ENV)
+        if path:
+            record = {'time': time.time(), 'marks': {name: elapsed for name, elapsed in self.marks}}
+            with open(path, 'a') as file:
+                file.write(json.dumps(record) + '\n')
+
+
+STARTUP = StartupTimer()
@@ -0,0 +1,293 @@
+import random
+import threading
+import time
+import math
+import mmap
+import numpy as np
+from collections import namedtuple
+from profiler import PROFILER
+
+TelemetrySnapshot = namedtuple('TelemetrySnapshot', ['timestamp', 'cpu_temp', 'cpu_usage', 'ram_usage', 'fan_speed'])
+
+EMPTY_SNAPSHOT = TelemetrySnapshot(0.0, 0, 0, 0, 0)
+
+HISTORY_WINDOWS = {'1m': 60, '10m': 600, '1h': 3600}
+
+
+class TelemetryHistory:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(TelemetrySnapshot._fields)), dtype=np.float64)
+        self.head = 0
+        self.count = 0
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def append(self, snapshot):
+        with self.lock:
+            self.samples[self.head] = snapshot
+            self.head = (self.head + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+            self.total += 1
+
+    def latest(self, n, field=None):
+        with self.lock:
+            n = min(n, self.count)
+            start = (self.head - n) % self.capacity
+            if start + n <= self.capacity:
+                rows = self.samples[start:start + n].copy()
+            else:
+                rows = np.concatenate((self.samples[start:], self.samples[:self.head]))
+        if field is None:
+            return rows
+        return rows[:, TelemetrySnapshot._fields.index(field)]
+
+    def window(self, seconds, field):
+        rows = self.latest(self.count)
+        if len(rows) == 0:
+            return np.zeros(0), np.zeros(0)
+        timestamps = rows[:, 0]
+        start = np.searchsorted(timestamps, timestamps[-1] - seconds, side='left')
+        return timestamps[start:], rows[start:, TelemetrySnapshot._fields.index(field)]
+
+    def window_stats(self, seconds, field):
+        _, values = self.window(seconds, field)
+        if len(values) == 0:
+            return None
+        return values.min(), values.max(), values.mean()
+
+    def downsample(self, seconds, field, buckets):
+        _, values = self.window(seconds, field)
+        if len(values) == 0:
+            return np.zeros((0, 3))
+        chunks = np.array_split(values, min(buckets, len(values)))
+        return np.array([(chunk.min(), chunk.max(), chunk.mean()) for chunk in chunks])
+
+
+BASE_TEMP = 40
+TRACE_DTYPE = np.float64
+
+
+def snapshot_from_usage(timestamp, cpu_usage, ram_usage, temp_noise, extra_temp=0.0):
+    cpu_temp = BASE_TEMP + (cpu_usage / 100 * 40) + temp_noise + extra_temp
+    fan_speed = int(1000 + (cpu_temp - BASE_TEMP) * 50)
+    return TelemetrySnapshot(timestamp, cpu_temp, cpu_usage, ram_usage, fan_speed)
+
+
+class TelemetrySource:
+    def read(self, timestamp):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PsutilSource(TelemetrySource):
+    def __init__(self):
+        import psutil
+        self.psutil = psutil
+
+    def read(self, timestamp):
+        cpu_usage = self.psutil.cpu_percent()
+        memory = self.psutil.virtual_memory()
+        return snapshot_from_usage(timestamp, cpu_usage, memory.percent, random.uniform(-2, 2))
+
+
+class SyntheticSource(TelemetrySource):
+    def __init__(self, seed=0, base_usage=25.0, ramp=0.0, noise=5.0, ram_usage=45.0,
+                 spike_probability=0.02, spike_usage=95.0, spike_length=5,
+                 runaway_after=None, runaway_rate=0.5):
+        self.rng = random.Random(seed)
+        self.base_usage = base_usage
+        self.ramp = ramp
+        self.noise = noise
+        self.ram_usage = ram_usage
+        self.spike_probability = spike_probability
+        self.spike_usage = spike_usage
+        self.spike_length = spike_length
+        self.runaway_after = runaway_after
+        self.runaway_rate = runaway_rate
+        self.index = 0
+        self.spike_remaining = 0
+
+    def read(self, timestamp):
+        rng = self.rng
+        cpu_usage = self.base_usage + self.ramp * self.index + rng.uniform(-self.noise, self.noise)
+
+        if self.spike_remaining == 0 and rng.random() < self.spike_probability:
+            self.spike_remaining = self.spike_length
+        if self.spike_remaining > 0:
+            self.spike_remaining -= 1
+            cpu_usage = max(cpu_usage, self.spike_usage)
+        cpu_usage = min(100.0, max(0.0, cpu_usage))
+
+        extra_temp = 0.0
+        if self.runaway_after is not None and self.index >= self.runaway_after:
+            extra_temp = self.runaway_rate * (self.index - self.runaway_after)
+
+        ram_usage = min(100.0, max(0.0, self.ram_usage + rng.uniform(-1, 1)))
+        self.index += 1
+        return snapshot_from_usage(timestamp, cpu_usage, ram_usage, rng.uniform(-2, 2), extra_temp)
+
+
+class ReplaySource(TelemetrySource):
+    def __init__(self, path, loop=True, records=None):
+        self.path = path
+        self.loop = loop
+        self.index = 0
+        self.last = EMPTY_SNAPSHOT
+        self.file = None
+        self.mapping = None
+        self.records = records
+        if records is not None:
+            return
+        if path.endswith('.csv'):
+            self.file = open(path, 'rb')
+            self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.mapping.readline()
+            self.data_start = self.mapping.tell()
+        else:
+            self.records = np.memmap(path, dtype=TRACE_DTYPE, mode='r').reshape(-1, len(TelemetrySnapshot._fields))
+
+    def next_record(self):
+        if self.records is not None:
+            if self.index >= len(self.records):
+                if not self.loop or len(self.records) == 0:
+                    return None
+                self.index = 0
+            record = self.records[self.index]
+            self.index += 1
+            return record.tolist()
+
+        line = self.mapping.readline()
+        if not line.strip():
+            if not self.loop or self.index == 0:
+                return None
+            self.mapping.seek(self.data_start)
+            self.index = 0
+            line = self.mapping.readline()
+        self.index += 1
+        return [float(value) for value in line.split(b',')]
+
+    def read(self, timestamp):
+        record = self.next_record()
+        if record is not None:
+            self.last = TelemetrySnapshot(timestamp, record[1], record[2], record[3], int(record[4]))
+        return self.last._replace(timestamp=timestamp)
+
+    def close(self):
+        if self.mapping is not None:
+            self.mapping.close()
+            self.file.close()
+        self.records = None
+
+
+class RecordingSource(TelemetrySource):
+    def __init__(self, source):
+        self.source = source
+        self.snapshots = []
+
+    def read(self, timestamp):
+        snapshot = self.source.read(timestamp)
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def close(self):
+        self.source.close()
+
+
+def write_trace(path, snapshots):
+    if path.endswith('.csv'):
+        with open(path, 'w') as file:
+            file.write(','.join(TelemetrySnapshot._fields) + '\n')
+            for snapshot in snapshots:
+                file.write(','.join(repr(float(value)) for value in snapshot) + '\n')
+    else:
+        with open(path, 'wb') as file:
+            for snapshot in snapshots:
+                file.write(np.asarray(snapshot, dtype=TRACE_DTYPE).tobytes())
+
+
+def create_source(spec):
+    kind, _, argument = spec.partition(':')
+    if kind == 'psutil':
+        return PsutilSource()
+    if kind == 'synthetic':
+        return SyntheticSource(seed=int(argument or 0))
+    if kind == 'replay':
+        return ReplaySource(argument)
+    raise ValueError(f"Unknown telemetry source: {spec}")
+
+
+class SystemMonitor:
+    def __init__(self, to_show = True, sample_interval=1.0, source=None):
+        self.snapshot = EMPTY_SNAPSHOT
+        if source is None and to_show:
+            source = PsutilSource()
+        self.source = source
+        self.last_poll = None
+        self.to_show = to_show
+        self.sample_interval = sample_interval
+        self.sampler_thread = None
+        self.stop_event = threading.Event()
+        self.history = TelemetryHistory(math.ceil(max(HISTORY_WINDOWS.values()) / sample_interval) + 1)
+        if to_show:
+            self.publish(self.sample(0.0))
+
+    @property
+    def cpu_temp(self):
+        return self.snapshot.cpu_temp
+
+    @property
+    def cpu_usage(self):
+        return self.snapshot.cpu_usage
+
+    @property
+    def ram_usage(self):
+        return self.snapshot.ram_usage
+
+    @property
+    def fan_speed(self):
+        return self.snapshot.fan_speed
+
+    def sample(self, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        started = PROFILER.start()
+        snapshot = self.source.read(timestamp)
+        PROFILER.stop('telemetry', started)
+        return snapshot
+
+    def publish(self, snapshot):
+        self.snapshot = snapshot
+        self.history.append(snapshot)
+
+    def update_system_info(self):
+        self.publish(self.sample())
+
+        if self.to_show:
+            return self.snapshot._asdict()
+
+    def poll(self, now):
+        if not self.to_show or self.sampler_thread is not None:
+            return
+        if self.last_poll is None or now - self.last_poll >= self.sample_interval:
+            self.last_poll = now
+            self.publish(self.sample(now))
+
+    def start(self):
+        if self.sampler_thread is not None and self.sampler_thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.sampler_thread = threading.Thread(target=self.run_sampler, name='SystemMonitor', daemon=True)
+        self.sampler_thread.start()
+
+    def stop(self, timeout=None):
+        self.stop_event.set()
+        if self.sampler_thread is not None:
+            self.sampler_thread.join(timeout)
+            self.sampler_thread = None
+
+    def run_sampler(self):
+        while not self.stop_event.wait(self.sample_interval):
+            self.publish(self.sample())
@@ -0,0 +1,25 @@
+import json
+import sqlite3
+import pytest
+from audit import AuditLog, AUDIT_FIELDS
+
+
+@pytest.mark.parametrize('name', ['audit.jsonl', 'audit.db'])
+def test_close_flushes_every_queued_row(tmp_path, name):
+    path = str(tmp_path / name)
+    log = AuditLog(path, 'admin', batch_size=64, sync_interval=60.0)
+    for i in range(2000):
+        log.record(i, i / 60, 0, i, 'color' if i % 3 else None, 'remove', 'correct')
+    log.close()
+    assert log.written == 2000
+
+    if name.endswith('.db'):
+        connection = sqlite3.connect(path)
+        rows = connection.execute(f"SELECT {', '.join(AUDIT_FIELDS)} FROM audit ORDER BY id").fetchall()
+        connection.close()
+        rows = [dict(zip(AUDIT_FIELDS, row)) for row in rows]
+    else:
+        with open(path) as file:
+            rows = [json.loads(line) for line in file]
+    assert [row['screw_id'] for row in rows] == list(range(2000))
+    assert {row['operator'] for row in rows} == {'admin'}
@@ -0,0 +1,28 @@
+import json
+from credentials import CredentialStore
+
+
+def test_default_users_are_hashed(tmp_path):
+    store = CredentialStore(str(tmp_path / 'users.json'))
+    assert store.verify('admin', '1234')
+    assert not store.verify('admin', 'wrong')
+    assert not store.verify('nobody', '1234')
+
+    with open(store.path) as file:
+        entries = json.load(file)['users']
+    assert all('password' not in entry and 'hash' in entry for entry in entries)
+
+
+def test_migrate_and_reload_on_change(tmp_path):
+    path = tmp_path / 'users.json'
+    path.write_text(json.dumps({'users': [{'username': 'old', 'password': 'secret'}]}))
+    store = CredentialStore(str(path))
+    assert store.verify('old', 'secret')
+
+    assert store.migrate() == 1
+    assert 'hash' in json.loads(path.read_text())['users'][0]
+    assert store.verify('old', 'secret')
+
+    store.set_password('new', 'pass')
+    assert CredentialStore(str(path)).verify('new', 'pass')
+    assert store.verify('new', 'pass')
@@ -0,0 +1,45 @@
+import factory
+from factory import FactoryRunner, STAT_FIELDS, make_stations, record_trace, simulate_station
+
+
+SCENARIO = {'duration': 30.0, 'telemetry': 'synthetic:2'}
+
+
+def test_aggregate_matches_per_station_results():
+    stations = make_stations(3, lanes_per_station=2, seed=7)
+    stats = FactoryRunner(stations, SCENARIO, workers=1).run()
+
+    trace = record_trace(SCENARIO)
+    results = [simulate_station(station, SCENARIO, trace) for station in stations]
+    assert stats['stations'] == 3 and stats['lanes'] == 6
+    for field in STAT_FIELDS:
+        assert stats[field] == sum(result[field] for result in results)
+    health = [value for result in results for value in result['machine_health']]
+    assert stats['machine_health']['min'] == min(health)
+
+
+def test_pool_matches_single_process():
+    stations = make_stations(4, seed=3)
+    single = FactoryRunner(stations, SCENARIO, workers=1).run()
+    pooled = FactoryRunner(stations, SCENARIO, workers=2).run()
+    for field in STAT_FIELDS + ('critical_failures', 'machine_health'):
+        assert single[field] == pooled[field]
+
+
+def test_telemetry_is_sampled_once(monkeypatch):
+    created = []
+    create_source = factory.create_source
+
+    def counting_create_source(spec):
+        created.append(spec)
+        return create_source(spec)
+
+    monkeypatch.setattr(factory, 'create_source', counting_create_source)
+    stations = make_stations(2, seed=1) + make_stations(1, seed=1)
+    stats = FactoryRunner(stations, SCENARIO, workers=1).run()
+    assert created == ['synthetic:2']
+    assert stats['good_count'] > 0
+
+    trace = record_trace(SCENARIO)
+    first, _, again = [simulate_station(station, SCENARIO, trace) for station in stations]
+    assert first == dict(again, station_id=first['station_id'])
@@ -0,0 +1,39 @@
+from notifications import NotificationRing
+
+
+def test_duplicates_coalesce_and_text_changes_once_per_interval():
+    ring = NotificationRing(min_interval=0.5)
+    ring.push("Missed defective product!", 0.0)
+    version = ring.version
+    for i in range(1, 14):
+        ring.push("Missed defective product!", i * 0.01)
+        ring.update(i * 0.01)
+
+    (notification,) = ring.latest(3)
+    assert notification.count == 14
+    assert notification.text == "Missed defective product!"
+    assert ring.version == version
+
+    ring.update(0.5)
+    assert notification.text == "Missed defective product! ×14"
+    assert notification.time == 0.13
+
+
+def test_capacity_and_expiry_stay_bounded():
+    ring = NotificationRing(capacity=4, duration=1.0)
+    for i in range(1000):
+        ring.push(f"alarm {i}", i * 0.01)
+        ring.update(i * 0.01)
+        assert len(ring) <= 4
+        assert len(ring.expiry) <= 4 * ring.capacity + 1
+
+    assert [n.message for n in ring.latest(2)] == ["alarm 998", "alarm 999"]
+    ring.update(100.0)
+    assert len(ring) == 0
+
+
+def test_per_key_rate_limits():
+    ring = NotificationRing(min_interval=0.5, rate_limits={"fire": 0.0})
+    ring.push("fire", 0.0)
+    ring.push("fire", 0.1)
+    assert ring.latest(1)[0].text == "fire ×2"
@@ -0,0 +1,42 @@
+import pygame
+import pytest
+from app_context import AppContext
+from game import Game
+from session import InputPlayback, INPUT_KEY, INPUT_CLICK, line_counters
+from simulation import INSPECTION_X
+from telemetry import create_source
+
+
+@pytest.fixture(scope='module')
+def context():
+    context = AppContext(telemetry_spec='synthetic:1')
+    yield context
+    context.close()
+
+
+def record_session(context, path, ticks):
+    game = Game('tester', telemetry_source=create_source('synthetic:3'), seed=11, record_path=str(path),
+                context=context)
+    line = game.production_line
+    for tick in range(ticks):
+        if tick % 30 == 0:
+            game.apply_input(INPUT_KEY, pygame.K_g if tick % 60 else pygame.K_d)
+        if tick % 45 == 0:
+            index = line.screw_index.nearest(INSPECTION_X)
+            if index >= 0:
+                game.apply_input(INPUT_CLICK, int(line.screws.x[index]), int(line.screws.y[index]) + 5)
+        game.update()
+    counters = line_counters(line)
+    game.recorder.save(game.tick, counters)
+    return counters
+
+
+def test_replay_reproduces_recorded_counters(context, tmp_path):
+    path = tmp_path / 'session.json'
+    recorded = record_session(context, path, 1800)
+    assert recorded['good_count'] + recorded['defective_count'] + recorded['false_positives'] > 0
+
+    playback = InputPlayback(str(path))
+    game = Game('replay', playback=playback, context=context)
+    assert game.replay() == playback.counters == recorded
+    assert playback.finished()
@@ -0,0 +1,46 @@
+from session_history import SessionStore
+
+
+def session(operator, score, level=1, day='2026-10-01', started_at=1.0e9):
+    return {'operator': operator, 'station': 'test', 'started_at': started_at, 'ended_at': started_at + 60,
+            'day': day, 'duration': 60.0, 'score': score, 'level': level}
+
+
+def test_leaderboard_one_row_per_operator_by_best_score(tmp_path):
+    store = SessionStore(str(tmp_path / 'sessions.db'))
+    for operator, score, level in [('admin', 100, 2), ('user', 300, 4), ('admin', 500, 5), ('user', 50, 1),
+                                   ('eve', 200, 3)]:
+        store.record(session(operator, score, level))
+
+    assert store.leaderboard(5) == [('admin', 500, 5, 2), ('user', 300, 4, 2), ('eve', 200, 3, 1)]
+    assert store.leaderboard(2) == [('admin', 500, 5, 2), ('user', 300, 4, 2)]
+
+
+def test_leaderboard_day_filter(tmp_path):
+    store = SessionStore(str(tmp_path / 'sessions.db'))
+    store.record(session('admin', 900, 6, day='2026-10-01'))
+    store.record(session('admin', 100, 2, day='2026-10-02'))
+    store.record(session('user', 300, 3, day='2026-10-02'))
+    store.record(session('user', 200, 2, day='2026-10-02'))
+
+    assert store.leaderboard(5, day='2026-10-02') == [('user', 300, 3, 2), ('admin', 100, 2, 1)]
+    assert store.leaderboard(5, day='2026-10-03') == []
+
+
+def test_leaderboard_cost_does_not_grow_with_history(tmp_path):
+    path = str(tmp_path / 'sessions.db')
+    store = SessionStore(path)
+    with store.connection() as connection:
+        connection.executemany(
+            "INSERT INTO sessions (operator, day, score, level) VALUES (?, ?, ?, ?)",
+            [(('admin', 'user')[i % 2], '2026-10-01', i, 1 + i % 9) for i in range(20000)],
+        )
+    store = SessionStore(path)
+    assert store.leaderboard(5) == [('user', 19999, 1 + 19999 % 9, 10000), ('admin', 19998, 1 + 19998 % 9, 10000)]
+
+    steps = []
+    connection = store.connection()
+    connection.set_progress_handler(lambda: steps.append(1), 100)
+    store.leaderboard(5)
+    connection.set_progress_handler(None, 100)
+    assert len(steps) < 10
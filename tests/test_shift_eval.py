@@ -0,0 +1,27 @@
+from shift_eval import ShiftCache, ShiftEvaluator, summarize
+
+PARAMS = {'shift_seconds': 20.0}
+POLICY = {'reaction_time': 0.5, 'miss_rate': 0.1, 'false_alarm_rate': 0.05}
+
+
+def test_repeated_evaluation_hits_cache(tmp_path):
+    evaluator = ShiftEvaluator(ShiftCache(str(tmp_path)), workers=1)
+    first = evaluator.evaluate(PARAMS, POLICY, [0, 1, 2])
+    assert (evaluator.hits, evaluator.misses) == (0, 3)
+
+    second = ShiftEvaluator(ShiftCache(str(tmp_path)), workers=1)
+    assert second.evaluate(PARAMS, POLICY, [0, 1, 2]) == first
+    assert (second.hits, second.misses) == (3, 0)
+    assert summarize(first)['shifts'] == 3
+
+
+def test_changed_policy_or_params_invalidate_cache(tmp_path):
+    evaluator = ShiftEvaluator(ShiftCache(str(tmp_path)), workers=1)
+    evaluator.evaluate(PARAMS, POLICY, [0, 1])
+
+    evaluator.evaluate(PARAMS, dict(POLICY, miss_rate=0.5), [0, 1])
+    assert (evaluator.hits, evaluator.misses) == (0, 4)
+    evaluator.evaluate(dict(PARAMS, conveyor_speed=3), POLICY, [0, 1, 2])
+    assert (evaluator.hits, evaluator.misses) == (0, 7)
+    evaluator.evaluate(PARAMS, POLICY, [1, 2])
+    assert (evaluator.hits, evaluator.misses) == (1, 8)
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from random_streams import RandomStreams
+from simulation import LineSimulation, LineGroup, TICK_SECONDS, INSPECTION_X
+from telemetry import SystemMonitor, SyntheticSource
+
+
+class AuditRows:
+    def __init__(self):
+        self.rows = []
+
+    def record(self, tick, time, lane, screw_id, defect_type, decision, outcome):
+        self.rows.append((screw_id, decision, outcome))
+
+
+def make_line(seed):
+    monitor = SystemMonitor(source=SyntheticSource(seed=seed))
+    line = LineSimulation(monitor, streams=RandomStreams(seed))
+    line.audit = AuditRows()
+    return line
+
+
+def counted(line):
+    return line.good_count + line.defective_count + line.missed_defects + line.false_positives
+
+
+def uncounted_on_belt(line):
+    screws = line.screws
+    n = screws.count
+    return int(np.count_nonzero(~screws.inspected[:n] & ~screws.marked_for_removal[:n]))
+
+
+@pytest.mark.parametrize('action', ['mark_good', 'mark_defective', 'remove_nearest'])
+def test_each_screw_is_counted_once(action):
+    line = make_line(5)
+    for tick in range(int(60 / TICK_SECONDS)):
+        line.step()
+        if tick % 20 == 0:
+            if action == 'remove_nearest':
+                index = line.screw_index.nearest(line.screws.x[:line.screws.count].mean()) \
+                    if line.screws.count else -1
+                if index >= 0 and not line.screws.marked_for_removal[index]:
+                    line.remove_screw(index)
+            else:
+                getattr(line, action)()
+
+    assert counted(line) == line.screws.next_id - uncounted_on_belt(line)
+    screw_ids = [row[0] for row in line.audit.rows]
+    assert len(screw_ids) == len(set(screw_ids))
+
+
+def test_line_group_counts_each_screw_once():
+    monitor = SystemMonitor(source=SyntheticSource(seed=5))
+    group = LineGroup(monitor, [1.0, 1.5], streams=RandomStreams(5))
+    for tick in range(int(60 / TICK_SECONDS)):
+        group.step()
+        if tick % 20 == 0:
+            group.production_lines[tick % 40 // 20].mark_good()
+
+    screws = group.screws
+    n = screws.count
+    uncounted = int(np.count_nonzero(~screws.inspected[:n] & ~screws.marked_for_removal[:n]))
+    assert sum(counted(line) for line in group.production_lines) == screws.next_id - uncounted
+
+
+@pytest.mark.parametrize('action', ['mark_good', 'mark_defective'])
+@pytest.mark.parametrize('defective', [False, True])
+def test_click_after_mark_does_not_count_again(action, defective):
+    line = make_line(5)
+    while not np.any(line.screws.defective[:line.screws.count] == defective):
+        line.step()
+    index = int(np.flatnonzero(line.screws.defective[:line.screws.count] == defective)[0])
+    screw = line.screws[index]
+    line.selected_screw_index = index
+
+    getattr(line, action)()
+    before = (counted(line), line.machine_health)
+    line.select_screw((screw.x, screw.y + 5))
+    line.select_screw((screw.x, screw.y + 5))
+
+    assert (counted(line), line.machine_health) == before
+    assert screw.marked_for_removal
+    assert [row[0] for row in line.audit.rows].count(screw.id) == 1
+
+
+def test_double_click_removes_once():
+    line = make_line(5)
+    while line.screws.count == 0:
+        line.step()
+    screw = line.screws[0]
+    line.select_screw((screw.x, screw.y + 5))
+    line.select_screw((screw.x, screw.y + 5))
+    assert counted(line) == 1
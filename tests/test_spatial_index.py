@@ -0,0 +1,45 @@
+import numpy as np
+from screw_store import ScrewStore
+from spatial_index import ScrewIndex
+from simulation import Screw
+
+
+def make_store(xs, lanes=None):
+    store = ScrewStore(Screw)
+    count = len(xs)
+    store.append(x=np.array(xs, dtype=float), y=np.full(count, 100.0), speed=np.full(count, 2.0),
+                 size=np.full(count, 20), defective=np.zeros(count, dtype=bool), defect_type=np.zeros(count),
+                 variant=np.zeros(count), lane=0 if lanes is None else np.array(lanes))
+    return store
+
+
+def test_nearest_matches_brute_force():
+    rng = np.random.default_rng(3)
+    xs = rng.uniform(0, 1200, 200)
+    store = make_store(xs)
+    store.inspected[:50] = True
+    store.marked_for_removal[50:60] = True
+    index = ScrewIndex(store)
+
+    available = np.flatnonzero(~store.inspected[:store.count] & ~store.marked_for_removal[:store.count])
+    for px in rng.uniform(0, 1200, 100):
+        expected = available[np.argmin(np.abs(store.x[available] - px))]
+        assert index.nearest(px) == expected
+
+
+def test_hit_test_and_lane_filter():
+    store = make_store([100, 300, 300], lanes=[0, 0, 1])
+    assert ScrewIndex(store).hit_test((300, 110)) == 1
+    assert ScrewIndex(store, lane=1).hit_test((300, 110)) == 2
+    assert ScrewIndex(store).hit_test((200, 110)) == -1
+
+
+def test_index_refreshes_after_store_changes():
+    store = make_store([100, 300])
+    index = ScrewIndex(store)
+    assert index.nearest(290) == 1
+    store.compact(np.array([True, False]))
+    assert index.nearest(290) == 0
+    store.append(x=np.array([280.0]), y=np.array([100.0]), speed=np.array([2.0]), size=np.array([20]),
+                 defective=np.array([False]), defect_type=np.array([0]), variant=np.array([0]))
+    assert index.nearest(290) == 1
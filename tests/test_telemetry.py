@@ -0,0 +1,41 @@
+import numpy as np
+from telemetry import TelemetryHistory, TelemetrySnapshot, SyntheticSource, ReplaySource, write_trace
+
+
+def snapshot(t):
+    return TelemetrySnapshot(float(t), 40.0 + t, float(t % 100), 50.0, 1000 + t)
+
+
+def test_history_wraps_and_keeps_latest_in_order():
+    history = TelemetryHistory(8)
+    for t in range(20):
+        history.append(snapshot(t))
+
+    assert history.count == 8 and history.total == 20
+    assert history.latest(5, 'timestamp').tolist() == [15.0, 16.0, 17.0, 18.0, 19.0]
+    assert history.latest(100, 'timestamp').tolist() == [float(t) for t in range(12, 20)]
+
+
+def test_history_window_stats_and_downsample():
+    history = TelemetryHistory(100)
+    for t in range(100):
+        history.append(snapshot(t))
+
+    timestamps, values = history.window(9, 'cpu_temp')
+    assert timestamps.tolist() == [float(t) for t in range(90, 100)]
+    assert history.window_stats(9, 'cpu_temp') == (130.0, 139.0, 134.5)
+    buckets = history.downsample(99, 'cpu_temp', 10)
+    assert buckets.shape == (10, 3)
+    assert np.allclose(buckets[:, 0], np.arange(40, 140, 10))
+
+
+def test_trace_round_trip(tmp_path):
+    source = SyntheticSource(seed=4)
+    snapshots = [source.read(float(t)) for t in range(50)]
+    for name in ('trace.csv', 'trace.bin'):
+        path = str(tmp_path / name)
+        write_trace(path, snapshots)
+        replay = ReplaySource(path, loop=False)
+        replayed = [replay.read(float(t)) for t in range(50)]
+        replay.close()
+        assert [tuple(s)[1:] for s in replayed] == [tuple(s)[1:] for s in snapshots]